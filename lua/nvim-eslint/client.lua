@@ -1,4 +1,5 @@
 local fs = require('nvim-eslint.fs')
+local profiler = require('nvim-eslint.profiler')
 local settings = require('nvim-eslint.settings')
 local watchers = require('nvim-eslint.watchers')
 
@@ -39,13 +40,13 @@ local function schedule_client_restart(client)
   end, 100)
 end
 
-local function handle_config_change(client, path)
+local handle_config_change = profiler.wrap('handle_config_change', function(client, path)
   if not fs.normalize(path) then
     return
   end
 
   schedule_client_restart(client)
-end
+end)
 
 M.handle_config_change = handle_config_change
 
@@ -57,7 +58,7 @@ local function ensure_watches(client, bufnr)
   watchers.ensure(client, settings.gather_watch_paths(bufnr), handle_config_change)
 end
 
-local function configuration_handler(_, result, ctx)
+local configuration_handler = profiler.wrap('configuration_handler', function(_, result, ctx)
   local function lookup_section(tbl, section)
     local keys = vim.split(section, '.', { plain = true }) ---@type string[]
     return vim.tbl_get(tbl, unpack(keys))
@@ -96,9 +97,9 @@ local function configuration_handler(_, result, ctx)
     end
   end
   return response
-end
+end)
 
-start_client_for_buffer = function(bufnr)
+start_client_for_buffer = profiler.wrap('start_client_for_buffer', function(bufnr)
   -- Skip non-file buffers (e.g. virtual buffers from diff plugins)
   if vim.bo[bufnr].buftype ~= '' then
     return
@@ -120,16 +121,16 @@ start_client_for_buffer = function(bufnr)
 
   vim.lsp.start({
     name = 'eslint',
-    cmd = user_config.cmd or settings.create_cmd(user_config),
+    cmd = M.create_cmd(),
     root_dir = root_dir,
     settings = M.make_settings(bufnr),
     capabilities = user_config.capabilities or M.make_client_capabilities(),
-    on_attach = function(client, buffer)
+    on_attach = profiler.wrap('on_attach', function(client, buffer)
       ensure_watches(client, buffer)
       if user_on_attach then
-        pcall(user_on_attach, client, buffer)
+        pcall(profiler.wrap('user_on_attach', user_on_attach), client, buffer)
       end
-    end,
+    end),
     on_exit = function(code, signal, client_id)
       watchers.unregister(client_id)
       if user_on_exit then
@@ -146,13 +147,13 @@ start_client_for_buffer = function(bufnr)
       ["eslint/probeFailed"] = function() return {} end,
     }),
   })
-end
+end)
 
 M.start_client_for_buffer = start_client_for_buffer
 
-function M.make_settings(bufnr)
+M.make_settings = profiler.wrap('make_settings', function(bufnr)
   return settings.make_settings(bufnr, user_config)
-end
+end)
 
 function M.make_client_capabilities()
   return settings.make_client_capabilities()
@@ -160,7 +161,7 @@ end
 
 function M.create_cmd()
   if user_config.cmd then
-    return user_config.cmd
+    return settings.wrap_trace_cmd(user_config.cmd, user_config)
   end
   return settings.create_cmd(user_config)
 end
@@ -203,7 +204,7 @@ function M.setup_lsp_start()
       user_config.filetypes or {}
     ),
     callback = function(args)
-      start_client_for_buffer(args.buf)
+      M.start_client_for_buffer(args.buf)
     end,
   })
 end
@@ -215,6 +216,7 @@ function M.setup(config)
     user_config = {}
   end
   M.user_config = user_config
+  profiler.setup(user_config.profile)
   M.setup_lsp_start()
 end
 
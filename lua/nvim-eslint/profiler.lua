@@ -0,0 +1,160 @@
+local uv = vim.uv or vim.loop
+
+local M = {}
+
+local enabled = false
+local output_file = nil
+local stack = {}
+local entries = {}
+local collapsed = {}
+
+function M.default_file()
+  return vim.fs.joinpath(vim.fn.stdpath('log'), 'nvim-eslint-profile.folded')
+end
+
+function M.is_enabled()
+  return enabled
+end
+
+function M.reset()
+  entries = {}
+  collapsed = {}
+end
+
+local function record(frame, elapsed)
+  local entry = entries[frame.name]
+  if not entry then
+    entry = { calls = 0, total_ns = 0, self_ns = 0, max_ns = 0 }
+    entries[frame.name] = entry
+  end
+
+  entry.calls = entry.calls + 1
+  -- Recursive calls are already covered by the outermost frame.
+  if not frame.recursive then
+    entry.total_ns = entry.total_ns + elapsed
+  end
+  entry.self_ns = entry.self_ns + (elapsed - frame.child_ns)
+  if elapsed > entry.max_ns then
+    entry.max_ns = elapsed
+  end
+
+  collapsed[frame.path] = (collapsed[frame.path] or 0) + (elapsed - frame.child_ns)
+end
+
+-- Adds the traceback of the failing call so errors raised while profiling
+-- are as easy to locate as without it. Non-string errors pass through as is,
+-- and an error rethrown by an enclosing wrapped call keeps the innermost
+-- traceback only.
+local traced = nil
+local function traceback(err)
+  if err ~= traced then
+    traced = debug.traceback(err, 2)
+  end
+  return traced
+end
+
+-- Returns a function that times `fn` under `name` while profiling is enabled
+-- and calls it directly otherwise, so entry points can be wrapped once when
+-- they are defined.
+function M.wrap(name, fn)
+  local function finish(frame, start, ok, ...)
+    local elapsed = uv.hrtime() - start
+    stack[#stack] = nil
+    local parent = stack[#stack]
+    if parent then
+      parent.child_ns = parent.child_ns + elapsed
+    end
+    record(frame, elapsed)
+
+    if not ok then
+      error(..., 0)
+    end
+    return ...
+  end
+
+  return function(...)
+    if not enabled then
+      return fn(...)
+    end
+
+    local parent = stack[#stack]
+    local frame = {
+      name = name,
+      path = parent and (parent.path .. ';' .. name) or name,
+      child_ns = 0,
+      recursive = false,
+    }
+    for _, active in ipairs(stack) do
+      if active.name == name then
+        frame.recursive = true
+        break
+      end
+    end
+    stack[#stack + 1] = frame
+    local args = { n = select('#', ...), ... }
+    return finish(
+      frame,
+      uv.hrtime(),
+      xpcall(function()
+        return fn(unpack(args, 1, args.n))
+      end, traceback)
+    )
+  end
+end
+
+function M.report()
+  local rows = {}
+  for name, entry in pairs(entries) do
+    table.insert(rows, {
+      name = name,
+      calls = entry.calls,
+      total_ms = entry.total_ns / 1e6,
+      self_ms = entry.self_ns / 1e6,
+      mean_ms = entry.total_ns / entry.calls / 1e6,
+      max_ms = entry.max_ns / 1e6,
+    })
+  end
+  table.sort(rows, function(a, b)
+    return a.total_ms > b.total_ms
+  end)
+  return rows
+end
+
+-- Writes one `frame;frame;frame <self time in microseconds>` line per call
+-- stack, the folded format read by flamegraph.pl, inferno and speedscope.
+function M.write_collapsed(path)
+  path = path or output_file or M.default_file()
+  local paths = vim.tbl_keys(collapsed)
+  table.sort(paths)
+
+  local lines = {}
+  for _, stack_path in ipairs(paths) do
+    local us = math.floor(collapsed[stack_path] / 1000 + 0.5)
+    if us > 0 then
+      table.insert(lines, ('%s %d'):format(stack_path, us))
+    end
+  end
+
+  vim.fn.mkdir(vim.fn.fnamemodify(path, ':h'), 'p')
+  vim.fn.writefile(lines, path)
+  return path
+end
+
+function M.setup(profile)
+  enabled = profile and true or false
+  if not enabled then
+    return
+  end
+
+  output_file = type(profile) == 'table' and profile.file or M.default_file()
+  vim.api.nvim_create_autocmd('VimLeavePre', {
+    group = vim.api.nvim_create_augroup('nvim-eslint-profiler', { clear = true }),
+    callback = function()
+      if not vim.tbl_isempty(collapsed) then
+        M.write_collapsed()
+      end
+    end,
+  })
+end
+
+return M
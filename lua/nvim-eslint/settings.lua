@@ -132,22 +132,51 @@ function M.make_client_capabilities()
   return default_capabilities
 end
 
+function M.default_trace_file()
+  return vim.fs.joinpath(vim.fn.stdpath('log'), 'nvim-eslint-rpc-trace.ndjson')
+end
+
+function M.wrap_trace_cmd(cmd, user_config)
+  local trace = user_config and user_config.trace
+  if not trace or type(cmd) ~= 'table' then
+    return cmd
+  end
+  if trace == true then
+    trace = {}
+  end
+
+  local wrapped = {
+    trace.python or 'python3',
+    M.get_plugin_root() .. '/tools/rpc-trace/eslint_rpc_proxy.py',
+    '--output',
+    trace.file or M.default_trace_file(),
+  }
+  if trace.payloads then
+    table.insert(wrapped, '--payloads')
+  end
+  table.insert(wrapped, '--')
+  return vim.list_extend(wrapped, cmd)
+end
+
 function M.create_cmd(user_config)
   local debug_mode = false
   if user_config and user_config.debug then
     debug_mode = true
   end
 
+  local cmd
   if debug_mode then
-    return {
+    cmd = {
       'node',
       '--inspect-brk',
       M.get_plugin_root() .. '/vscode-eslint/server/out/eslintServer.js',
       '--stdio',
     }
+  else
+    cmd = { 'node', M.get_plugin_root() .. '/vscode-eslint/server/out/eslintServer.js', '--stdio' }
   end
 
-  return { 'node', M.get_plugin_root() .. '/vscode-eslint/server/out/eslintServer.js', '--stdio' }
+  return M.wrap_trace_cmd(cmd, user_config)
 end
 
 function M.gather_watch_paths(bufnr)
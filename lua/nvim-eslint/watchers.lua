@@ -1,4 +1,5 @@
 local fs = require('nvim-eslint.fs')
+local profiler = require('nvim-eslint.profiler')
 
 local uv = vim.uv or vim.loop
 
@@ -32,7 +33,7 @@ local function ensure_directory_watcher(dir)
       return
     end
 
-    vim.schedule(function()
+    vim.schedule(profiler.wrap('watchers.fs_event', function()
       local current = watched_directories[dir]
       if not current then
         return
@@ -54,7 +55,7 @@ local function ensure_directory_watcher(dir)
           interested[client_id] = nil
         end
       end
-    end)
+    end))
   end)
 
   if not ok then
@@ -153,4 +154,18 @@ function M.unregister(client_id)
   clients_by_watch[client_id] = nil
 end
 
+function M.stats()
+  local stats = { directories = 0, files = 0, clients = 0 }
+  for _, entry in pairs(watched_directories) do
+    stats.directories = stats.directories + 1
+    for _ in pairs(entry.files) do
+      stats.files = stats.files + 1
+    end
+  end
+  for _ in pairs(clients_by_watch) do
+    stats.clients = stats.clients + 1
+  end
+  return stats
+end
+
 return M
@@ -0,0 +1,54 @@
+"""Helpers shared by the benchmark runners and the stand-in server suite.
+Scripts outside this directory add it to ``sys.path``."""
+
+from __future__ import annotations
+
+import json
+import statistics
+import subprocess
+from pathlib import Path
+from typing import Any, Dict, List
+
+
+def run_command(
+    command: List[str], *, cwd: Path | None = None, env: Dict[str, str] | None = None
+) -> subprocess.CompletedProcess[str]:
+    return subprocess.run(command, cwd=cwd, env=env, text=True, capture_output=True)
+
+
+def git_revision(repo_root: Path) -> str | None:
+    result = run_command(["git", "rev-parse", "--short", "HEAD"], cwd=repo_root)
+    return result.stdout.strip() if result.returncode == 0 else None
+
+
+def distribution(values: List[float]) -> Dict[str, float] | None:
+    if not values:
+        return None
+    ordered = sorted(values)
+    return {
+        "count": len(ordered),
+        "min": round(ordered[0], 2),
+        "median": round(statistics.median(ordered), 2),
+        "p95": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))], 2),
+        "max": round(ordered[-1], 2),
+    }
+
+
+def parse_json_lines(stream: str) -> List[Dict[str, Any]]:
+    entries: List[Dict[str, Any]] = []
+    for line in stream.splitlines():
+        text = line.strip()
+        if not text.startswith("{"):
+            continue
+        try:
+            entries.append(json.loads(text))
+        except json.JSONDecodeError as exc:  # noqa: PERF203 - keep informative error message
+            raise ValueError(f"Failed to parse JSON line: {text}\n{exc}") from exc
+    return entries
+
+
+def find_record(output: str, record_type: str) -> Dict[str, Any] | None:
+    """Return the last ``{"type": record_type}`` line a headless driver printed."""
+
+    records = [entry for entry in parse_json_lines(output) if entry.get("type") == record_type]
+    return records[-1] if records else None
@@ -0,0 +1,15 @@
+local script_path = debug.getinfo(1, "S").source:sub(2)
+local script_dir = vim.fn.fnamemodify(script_path, ":p:h")
+local repo_root = vim.fn.fnamemodify(script_dir, ":h:h")
+
+vim.opt.runtimepath:append(repo_root)
+
+-- Benchmarks pass the plugin config (settings overrides, a stand-in server
+-- `cmd`, ...) as JSON so runs with different settings can be compared.
+local config = {}
+local raw = vim.env.NVIM_ESLINT_BENCH_CONFIG
+if raw and raw ~= "" then
+  config = vim.json.decode(raw)
+end
+
+require("nvim-eslint").setup(config)
@@ -0,0 +1,115 @@
+-- Helpers shared by the headless drivers of the benchmarks and the stand-in
+-- server suite. Load with dofile(); this file is not on the runtimepath.
+
+local M = {}
+
+local uv = vim.uv or vim.loop
+
+function M.elapsed_ms(start)
+  return (uv.hrtime() - start) / 1e6
+end
+
+function M.read_json(path)
+  local fd, err = io.open(path, "r")
+  if not fd then
+    error(("failed to read %s: %s"):format(path, err))
+  end
+  local content = fd:read("*a")
+  fd:close()
+  return vim.json.decode(content)
+end
+
+function M.eslint_client_attached(bufnr)
+  for _, client in ipairs(vim.lsp.get_clients({ bufnr = bufnr })) do
+    if client.name == "eslint" then
+      return true
+    end
+  end
+  return false
+end
+
+function M.buffer_version(bufnr)
+  local versions = vim.lsp.util.buf_versions
+  return (versions and versions[bufnr]) or vim.b[bufnr].changedtick
+end
+
+-- Records every lint pass that reaches Neovim, per buffer, so drivers can tell
+-- "linted with zero diagnostics" apart from "not linted yet". Servers that push
+-- are seen through the publishDiagnostics handler. Servers that only answer
+-- pull requests (the bundled eslintServer.js advertises `diagnosticProvider`
+-- and never pushes) are seen through the LspRequest autocmd: the buffer
+-- version is captured when a textDocument/diagnostic request is sent, and the
+-- pass is recorded when its response completes. Cancelled requests are not
+-- lint passes.
+--
+-- `tracker.of(bufnr)` returns the live list of `{ at, version, count, source }`.
+function M.track_lint_passes()
+  local by_buffer = {}
+  local tracker = {}
+
+  function tracker.of(bufnr)
+    local list = by_buffer[bufnr]
+    if not list then
+      list = {}
+      by_buffer[bufnr] = list
+    end
+    return list
+  end
+
+  local original = vim.lsp.handlers["textDocument/publishDiagnostics"]
+  vim.lsp.handlers["textDocument/publishDiagnostics"] = function(err, result, ctx, config)
+    local ret = original(err, result, ctx, config)
+    if result and result.uri then
+      table.insert(tracker.of(vim.uri_to_bufnr(result.uri)), {
+        at = uv.hrtime(),
+        version = result.version,
+        count = #(result.diagnostics or {}),
+        source = "push",
+      })
+    end
+    return ret
+  end
+
+  local requested = {}
+  vim.api.nvim_create_autocmd("LspRequest", {
+    group = vim.api.nvim_create_augroup("nvim-eslint-bench-lint-passes", { clear = true }),
+    callback = function(args)
+      local data = args.data or {}
+      local request = data.request or {}
+      if request.method ~= "textDocument/diagnostic" then
+        return
+      end
+
+      local bufnr = request.bufnr or args.buf
+      local key = ("%s:%s"):format(data.client_id, data.request_id)
+      if request.type == "pending" then
+        requested[key] = M.buffer_version(bufnr)
+        return
+      end
+
+      local version = requested[key]
+      requested[key] = nil
+      if request.type ~= "complete" or version == nil then
+        return
+      end
+
+      local at = uv.hrtime()
+      -- The response handler that stores the diagnostics runs after this
+      -- autocmd; count them once it has.
+      vim.schedule(function()
+        vim.schedule(function()
+          table.insert(tracker.of(bufnr), {
+            at = at,
+            version = version,
+            count = vim.api.nvim_buf_is_valid(bufnr) and #vim.diagnostic.get(bufnr) or 0,
+            source = "pull",
+          })
+        end)
+      end)
+    end,
+  })
+
+  return tracker
+end
+
+return M
@@ -0,0 +1,133 @@
+-- Usage: nvim -l micro_bench.lua <options.json>
+--
+-- Times the per-buffer plugin functions against a synthetic directory tree and
+-- prints one JSON line with ops/sec samples per case. No language server is
+-- started; buffers are only named (bufadd), never loaded.
+
+local script_path = debug.getinfo(1, "S").source:sub(2)
+local script_dir = vim.fn.fnamemodify(script_path, ":p:h")
+local repo_root = vim.fn.fnamemodify(script_dir, ":h:h:h")
+
+vim.opt.runtimepath:prepend(repo_root)
+
+local uv = vim.uv or vim.loop
+local helpers = dofile(vim.fn.fnamemodify(script_dir, ":h") .. "/helpers.lua")
+local constants = require("nvim-eslint.constants")
+local fs = require("nvim-eslint.fs")
+local settings = require("nvim-eslint.settings")
+local watchers = require("nvim-eslint.watchers")
+
+-- The resolvers warn through vim.notify when a root is missing; count those
+-- instead of printing them once per iteration.
+local notifications = 0
+vim.notify = function()
+  notifications = notifications + 1
+end
+
+local function measure(fn, opts)
+  for i = 1, opts.warmup do
+    fn(i)
+  end
+
+  local samples = {}
+  local iterations = 0
+  for _ = 1, opts.samples do
+    local count = 0
+    local start = uv.hrtime()
+    local deadline = start + opts.duration_ms * 1e6
+    local now = start
+    while now < deadline do
+      count = count + 1
+      fn(count)
+      now = uv.hrtime()
+    end
+    table.insert(samples, count / ((now - start) / 1e9))
+    iterations = iterations + count
+    -- Let libuv finish closing handles released by the watcher cases.
+    uv.run("nowait")
+  end
+  return { ops_per_sec = samples, iterations = iterations }
+end
+
+local function build_cases(buffers, config_dirs)
+  local n = #buffers
+  local function buffer_at(i)
+    return buffers[(i - 1) % n + 1]
+  end
+
+  local client_id = 0
+  local noop = function() end
+
+  return {
+    { "make_settings", function(i)
+      settings.make_settings(buffer_at(i), {})
+    end },
+    { "resolve_git_dir", function(i)
+      settings.resolve_git_dir(buffer_at(i))
+    end },
+    { "resolve_package_json_dir", function(i)
+      settings.resolve_package_json_dir(buffer_at(i))
+    end },
+    { "resolve_eslint_config_dir", function(i)
+      settings.resolve_eslint_config_dir(buffer_at(i))
+    end },
+    { "use_flat_config", function(i)
+      settings.use_flat_config(buffer_at(i))
+    end },
+    { "gather_watch_paths", function(i)
+      settings.gather_watch_paths(buffer_at(i))
+    end },
+    { "collect_existing_paths", function(i)
+      fs.collect_existing_paths(config_dirs[(i - 1) % #config_dirs + 1], constants.WATCHED_CONFIG_FILENAMES)
+    end },
+    -- One op registers a fresh client on the watch paths of a buffer and
+    -- unregisters it again, which starts and stops the directory handles.
+    { "watchers.register+unregister", function(i)
+      client_id = client_id + 1
+      local client = { id = client_id }
+      for _, path in ipairs(settings.gather_watch_paths(buffer_at(i))) do
+        watchers.register(client, path, noop)
+      end
+      watchers.unregister(client_id)
+    end },
+  }
+end
+
+local function main(options_path)
+  local opts = helpers.read_json(options_path)
+  local measure_opts = {
+    warmup = opts.warmup or 50,
+    samples = opts.samples or 5,
+    duration_ms = opts.duration_ms or 200,
+  }
+
+  local buffers = {}
+  for _, path in ipairs(opts.files) do
+    table.insert(buffers, vim.fn.bufadd(path))
+  end
+  local config_dirs = {}
+  for _, bufnr in ipairs(buffers) do
+    table.insert(config_dirs, settings.resolve_eslint_config_dir(bufnr))
+  end
+
+  local only = opts.cases and #opts.cases > 0 and opts.cases or nil
+  local results = {}
+  for _, case in ipairs(build_cases(buffers, config_dirs)) do
+    local name, fn = case[1], case[2]
+    if not only or vim.tbl_contains(only, name) then
+      results[name] = measure(fn, measure_opts)
+    end
+  end
+
+  local version = vim.version()
+  io.stdout:write(vim.json.encode({
+    type = "results",
+    cases = results,
+    buffers = #buffers,
+    notifications = notifications,
+    watchers_left = watchers.stats(),
+    nvim_version = ("%d.%d.%d"):format(version.major, version.minor, version.patch),
+  }) .. "\n")
+end
+
+main(assert(_G.arg[1], "usage: nvim -l micro_bench.lua <options.json>"))
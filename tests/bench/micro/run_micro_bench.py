@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""Run the offline Lua microbenchmarks and compare them against a baseline.
+
+The runner builds a synthetic directory tree of configurable depth and width,
+times the per-buffer plugin functions over it with ``nvim -l micro_bench.lua``,
+and reports the median ops/sec of each case. Results can be stored as a
+baseline and later runs compared against it. No ESLint install or language
+server is needed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import shlex
+import statistics
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List
+
+# --- Section: Constants ---
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+REPO_ROOT = SCRIPT_DIR.parents[2]
+DEFAULT_DRIVER = SCRIPT_DIR / "micro_bench.lua"
+DEFAULT_BASELINE = SCRIPT_DIR / "baseline.json"
+CASES = (
+    "make_settings",
+    "resolve_git_dir",
+    "resolve_package_json_dir",
+    "resolve_eslint_config_dir",
+    "use_flat_config",
+    "gather_watch_paths",
+    "collect_existing_paths",
+    "watchers.register+unregister",
+)
+
+sys.path.insert(0, str(SCRIPT_DIR.parent))
+
+from bench_common import find_record, git_revision, run_command  # noqa: E402
+
+
+# --- Section: Synthetic tree ---
+
+
+def build_tree(root: Path, depth: int, width: int, files_per_dir: int) -> List[str]:
+    """Create a workspace ``depth`` directories deep with ``width`` children each.
+
+    The root holds ``.git``, ``package.json`` and a flat config. Every top-level
+    directory is a package with its own ``package.json``; every other package
+    also carries a legacy ``.eslintrc.json`` so both config lookups are
+    exercised. Source files live only in the deepest directories, so each
+    resolver walks the full height of the tree.
+    """
+
+    (root / ".git").mkdir(parents=True)
+    (root / "package.json").write_text('{"name": "micro-root", "private": true}\n')
+    (root / "eslint.config.mjs").write_text("export default [];\n")
+
+    files: List[str] = []
+    level = [root]
+    for current_depth in range(1, depth + 1):
+        next_level = []
+        for parent in level:
+            for index in range(width):
+                directory = parent / f"dir-{index}"
+                directory.mkdir()
+                if current_depth == 1:
+                    (directory / "package.json").write_text(f'{{"name": "pkg-{index}"}}\n')
+                    if index % 2:
+                        (directory / ".eslintrc.json").write_text('{"root": true}\n')
+                next_level.append(directory)
+        level = next_level
+
+    for directory in level:
+        for index in range(files_per_dir):
+            path = directory / f"file-{index}.ts"
+            path.write_text("export const value = 1;\n")
+            files.append(str(path))
+    return files
+
+
+# --- Section: Reporting ---
+
+
+def summarize(results: Dict[str, Any]) -> Dict[str, Dict[str, float]]:
+    summary = {}
+    for name, entry in results["cases"].items():
+        samples = entry["ops_per_sec"]
+        summary[name] = {
+            "ops_per_sec": round(statistics.median(samples), 1),
+            "min": round(min(samples), 1),
+            "max": round(max(samples), 1),
+            "iterations": entry["iterations"],
+        }
+    return summary
+
+
+def compare(
+    current: Dict[str, Dict[str, float]], baseline: Dict[str, Any] | None, tolerance: float
+) -> Dict[str, Dict[str, Any]]:
+    comparison: Dict[str, Dict[str, Any]] = {}
+    cases = (baseline or {}).get("cases", {})
+    for name, entry in current.items():
+        reference = cases.get(name, {}).get("ops_per_sec")
+        if not reference:
+            comparison[name] = {"baseline": None, "change": None, "regression": False}
+            continue
+        change = entry["ops_per_sec"] / reference - 1
+        comparison[name] = {
+            "baseline": reference,
+            "change": round(change, 3),
+            "regression": change < -tolerance,
+        }
+    return comparison
+
+
+def render_text(report: Dict[str, Any]) -> str:
+    lines = [
+        f"nvim {report['nvim_version']}, {report['buffers']} buffers, "
+        f"depth={report['tree']['depth']} width={report['tree']['width']}",
+        "",
+        f"  {'case':<32} {'ops/sec':>12} {'baseline':>12} {'change':>9}",
+    ]
+    for name, entry in report["cases"].items():
+        comparison = report["comparison"][name]
+        baseline = f"{comparison['baseline']:.1f}" if comparison["baseline"] else "-"
+        change = f"{comparison['change']:+.1%}" if comparison["change"] is not None else "-"
+        marker = "  REGRESSION" if comparison["regression"] else ""
+        lines.append(f"  {name:<32} {entry['ops_per_sec']:>12.1f} {baseline:>12} {change:>9}{marker}")
+    return "\n".join(lines)
+
+
+# --- Section: Entry point ---
+
+
+def parse_args(argv: List[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Offline microbenchmarks for the nvim-eslint Lua modules.")
+    parser.add_argument("--depth", type=int, default=4, help="Directory levels below the workspace root.")
+    parser.add_argument("--width", type=int, default=3, help="Child directories per directory.")
+    parser.add_argument("--files-per-dir", type=int, default=2, help="Source files in each deepest directory.")
+    parser.add_argument("--case", action="append", choices=CASES, dest="cases", help="Run only this case.")
+    parser.add_argument("--samples", type=int, default=5, help="Timed samples per case; the median is reported.")
+    parser.add_argument("--duration-ms", type=int, default=200, help="Length of each timed sample.")
+    parser.add_argument("--warmup", type=int, default=50, help="Untimed iterations before sampling.")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE, help="Baseline results to compare with.")
+    parser.add_argument("--save-baseline", action="store_true", help="Store this run as the new baseline.")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.25,
+        help="Slowdown relative to the baseline, as a fraction, that counts as a regression.",
+    )
+    parser.add_argument("--fail-on-regression", action="store_true", help="Exit non-zero when a case regresses.")
+    parser.add_argument("--nvim-cmd", default=os.environ.get("NVIM_COMMAND", "nvim"), help="Neovim executable.")
+    parser.add_argument("--driver", default=str(DEFAULT_DRIVER), help="Lua script run with nvim -l.")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON instead of a table.")
+    parser.add_argument("--output", type=Path, help="Write the JSON report to this file as well.")
+    args = parser.parse_args(argv)
+    if args.depth < 1 or args.width < 1 or args.files_per_dir < 1:
+        parser.error("--depth, --width and --files-per-dir must be positive")
+    return args
+
+
+def run(args: argparse.Namespace, workdir: Path) -> int:
+    files = build_tree(workdir / "tree", args.depth, args.width, args.files_per_dir)
+    options = workdir / "options.json"
+    options.write_text(
+        json.dumps(
+            {
+                "files": files,
+                "cases": args.cases or [],
+                "samples": args.samples,
+                "duration_ms": args.duration_ms,
+                "warmup": args.warmup,
+            }
+        )
+    )
+
+    command = shlex.split(args.nvim_cmd) + ["-l", str(Path(args.driver).resolve()), str(options)]
+    result = run_command(command, cwd=REPO_ROOT)
+    if result.returncode != 0:
+        print("nvim -l run failed:", file=sys.stderr)
+        sys.stderr.write(result.stdout)
+        sys.stderr.write(result.stderr)
+        return result.returncode
+
+    results = find_record(result.stdout or result.stderr, "results")
+    if results is None:
+        print("Missing results in nvim output", file=sys.stderr)
+        sys.stderr.write(result.stdout + result.stderr)
+        return 1
+
+    tree = {"depth": args.depth, "width": args.width, "files_per_dir": args.files_per_dir}
+    baseline = json.loads(args.baseline.read_text()) if args.baseline.exists() else None
+    if baseline and baseline.get("tree") != tree:
+        print(f"Baseline was recorded with tree {baseline.get('tree')}; comparison is approximate.", file=sys.stderr)
+
+    cases = summarize(results)
+    report = {
+        "plugin_revision": git_revision(REPO_ROOT),
+        "nvim_version": results.get("nvim_version"),
+        "tree": tree,
+        "buffers": results.get("buffers"),
+        "notifications": results.get("notifications"),
+        "cases": cases,
+        "comparison": compare(cases, baseline, args.tolerance),
+    }
+
+    text = json.dumps(report, indent=2)
+    print(text if args.json else render_text(report))
+    if args.output:
+        args.output.write_text(text + "\n")
+    if args.save_baseline:
+        stored = {key: report[key] for key in ("plugin_revision", "nvim_version", "tree", "cases")}
+        args.baseline.write_text(json.dumps(stored, indent=2) + "\n")
+        print(f"Baseline written to {args.baseline}")
+    elif baseline is None:
+        print(f"No baseline at {args.baseline}; run with --save-baseline to record one.", file=sys.stderr)
+
+    regressions = [name for name, entry in report["comparison"].items() if entry["regression"]]
+    if regressions and args.fail_on_regression:
+        print("Regressed cases: " + ", ".join(regressions), file=sys.stderr)
+        return 1
+    return 0
+
+
+def main(argv: List[str] | None = None) -> int:
+    args = parse_args(argv)
+    with tempfile.TemporaryDirectory(prefix="nvim-eslint-micro-") as tmp:
+        return run(args, Path(tmp))
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,123 @@
+local M = {}
+
+local uv = vim.uv or vim.loop
+
+local script_dir = vim.fn.fnamemodify(debug.getinfo(1, "S").source:sub(2), ":p:h")
+local helpers = dofile(vim.fn.fnamemodify(script_dir, ":h") .. "/helpers.lua")
+local elapsed_ms = helpers.elapsed_ms
+
+-- UI-thread time in plugin code comes from the plugin's own profiler, which
+-- the runner enables with `profile = { file = ... }`. Self times add up to the
+-- time spent in the outermost profiled calls, so nested entry points (e.g.
+-- make_settings inside start_client_for_buffer) are not counted twice.
+local function plugin_usage()
+  local profiler = require("nvim-eslint.profiler")
+  local usage = { total_ms = 0, calls = {}, entries = profiler.report() }
+  for _, entry in ipairs(usage.entries) do
+    usage.total_ms = usage.total_ms + entry.self_ms
+    usage.calls[entry.name] = entry.calls
+  end
+  usage.folded_file = profiler.write_collapsed()
+  return usage
+end
+
+local function read_rss_kb(pid)
+  local fd = io.open("/proc/" .. pid .. "/status", "r")
+  if not fd then
+    return nil
+  end
+  local content = fd:read("*a")
+  fd:close()
+  return tonumber(content:match("VmRSS:%s+(%d+)"))
+end
+
+local function process_tree()
+  local processes = {}
+  local function visit(pid)
+    for _, child in ipairs(vim.api.nvim_get_proc_children(pid)) do
+      local info = vim.api.nvim_get_proc(child)
+      table.insert(processes, {
+        pid = child,
+        name = type(info) == "table" and info.name or vim.NIL,
+        rss_kb = read_rss_kb(child) or vim.NIL,
+      })
+      visit(child)
+    end
+  end
+  visit(vim.fn.getpid())
+  return processes
+end
+
+local function fs_event_handles()
+  local count = 0
+  uv.walk(function(handle)
+    if handle:get_type() == "fs_event" then
+      count = count + 1
+    end
+  end)
+  return count
+end
+
+function M.run(opts)
+  opts = opts or {}
+  local files = opts.files or {}
+  local timeout = opts.timeout or 20000
+  local settle_ms = opts.settle_ms or 60000
+  local lint_passes = helpers.track_lint_passes()
+  if not require("nvim-eslint.profiler").is_enabled() then
+    error("the multi-root driver needs the plugin set up with profile enabled")
+  end
+
+  local buffers = {}
+  local attach_ms = {}
+  local start_all = uv.hrtime()
+  for _, path in ipairs(files) do
+    local start = uv.hrtime()
+    vim.cmd.edit(vim.fn.fnameescape(path))
+    local bufnr = vim.api.nvim_get_current_buf()
+    table.insert(buffers, bufnr)
+    if vim.wait(timeout, function()
+      return helpers.eslint_client_attached(bufnr)
+    end, 1) then
+      table.insert(attach_ms, elapsed_ms(start))
+    end
+  end
+  local open_ms = elapsed_ms(start_all)
+
+  vim.wait(settle_ms, function()
+    for _, bufnr in ipairs(buffers) do
+      if #lint_passes.of(bufnr) == 0 then
+        return false
+      end
+    end
+    return true
+  end, 50)
+
+  local diagnosed = 0
+  for _, bufnr in ipairs(buffers) do
+    if #lint_passes.of(bufnr) > 0 then
+      diagnosed = diagnosed + 1
+    end
+  end
+
+  local usage = plugin_usage()
+  vim.api.nvim_out_write(vim.fn.json_encode({
+    type = "summary",
+    buffers = #buffers,
+    attached = #attach_ms,
+    diagnosed = diagnosed,
+    open_ms = open_ms,
+    attach_ms = attach_ms,
+    clients = #vim.lsp.get_clients({ name = "eslint" }),
+    processes = process_tree(),
+    fs_event_handles = fs_event_handles(),
+    watchers = require("nvim-eslint.watchers").stats(),
+    plugin_ui_ms = usage.total_ms,
+    plugin_calls = usage.calls,
+    plugin_profile = usage.entries,
+    profile_file = usage.folded_file,
+  }) .. "\n")
+  return true
+end
+
+return M
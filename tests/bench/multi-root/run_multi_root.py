@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""Open hundreds of buffers across many package roots and bound resource usage.
+
+The suite generates a monorepo with ``generate_scale_fixture.py``, opens every
+file in headless Neovim (interleaving packages), and records the number of
+ESLint clients, server processes and their RSS, ``fs_event`` handles held by
+``watchers.lua``, time to attach per buffer, and UI-thread time spent inside
+plugin code as recorded by the plugin's profiler (``profile`` option), whose
+collapsed stacks are kept with ``--profile-output``. Each measurement is checked against an upper bound so scaling
+regressions fail CI.
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import json
+import os
+import shlex
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List
+
+# --- Section: Constants ---
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+REPO_ROOT = SCRIPT_DIR.parents[2]
+DEFAULT_INIT = SCRIPT_DIR.parent / "headless_init.lua"
+DEFAULT_DRIVER = SCRIPT_DIR / "headless_multi_root.lua"
+SCALE_FIXTURE_DIR = REPO_ROOT / "tests" / "e2e" / "scale-fixture"
+GENERATOR = SCALE_FIXTURE_DIR / "generate_scale_fixture.py"
+FAKE_SERVER = REPO_ROOT / "tests" / "e2e" / "fake-server" / "fake_eslint_server.py"
+CONFIG_ENV_VAR = "NVIM_ESLINT_BENCH_CONFIG"
+# eslintServer.js with a loaded config vs. the Python stand-in (~15 MB).
+DEFAULT_RSS_MB_PER_CLIENT = {"real": 350.0, "fake": 64.0}
+
+sys.path.insert(0, str(SCALE_FIXTURE_DIR))
+sys.path.insert(0, str(SCRIPT_DIR.parent))
+
+from bench_common import distribution, find_record, run_command  # noqa: E402
+from generate_scale_fixture import REQUIRED_MODULES, default_module_store  # noqa: E402
+
+
+# --- Section: Fixture ---
+
+
+def generate_fixture(args: argparse.Namespace, fixture: Path, store: Path | None) -> List[str]:
+    """Generate the workspace and return file paths interleaved across packages."""
+
+    command = [
+        sys.executable,
+        str(GENERATOR),
+        str(fixture),
+        "--force",
+        "--packages",
+        str(args.packages),
+        "--files-per-package",
+        str(args.files_per_package),
+        "--lines-per-file",
+        str(args.lines_per_file),
+    ]
+    # Without a git root every package.json directory becomes its own LSP root.
+    if args.roots == "package":
+        command.append("--no-git")
+    if store is not None:
+        command += ["--node-modules", str(store)]
+    result = run_command(command)
+    if result.returncode != 0:
+        raise RuntimeError(f"Fixture generation failed:\n{result.stdout}{result.stderr}")
+
+    manifest = json.loads((fixture / "scale-fixture.json").read_text())
+    per_package = [[str(fixture / entry["path"]) for entry in package["files"]] for package in manifest["packages"]]
+    return [path for group in itertools.zip_longest(*per_package) for path in group if path]
+
+
+def resolve_server(args: argparse.Namespace, store: Path | None) -> str:
+    if args.server != "auto":
+        return args.server
+    if store is not None and all((store / name).exists() for name in REQUIRED_MODULES):
+        return "real"
+    print("No ESLint module store found; measuring against the stand-in server.", file=sys.stderr)
+    return "fake"
+
+
+# --- Section: Metrics ---
+
+
+def build_report(summary: Dict[str, Any], args: argparse.Namespace, server: str, roots: int) -> Dict[str, Any]:
+    processes = summary.get("processes") or []
+    rss_kb = sum(process["rss_kb"] for process in processes if isinstance(process.get("rss_kb"), int))
+    buffers = summary.get("buffers", 0)
+    return {
+        "settings": {
+            "server": server,
+            "roots": args.roots,
+            "packages": args.packages,
+            "files_per_package": args.files_per_package,
+            "expected_roots": roots,
+        },
+        "buffers": buffers,
+        "attached": summary.get("attached"),
+        "diagnosed": summary.get("diagnosed"),
+        "clients": summary.get("clients"),
+        "server_processes": len(processes),
+        "node_processes": sum(1 for process in processes if "node" in str(process.get("name"))),
+        "server_rss_mb": round(rss_kb / 1024, 1),
+        "fs_event_handles": summary.get("fs_event_handles"),
+        "watchers": summary.get("watchers"),
+        "open_ms": round(summary.get("open_ms", 0), 1),
+        "attach_ms": distribution(summary.get("attach_ms") or []),
+        "plugin_ui_ms": round(summary.get("plugin_ui_ms", 0), 2),
+        "plugin_ui_ms_per_buffer": round(summary.get("plugin_ui_ms", 0) / buffers, 3) if buffers else None,
+        "plugin_calls": summary.get("plugin_calls"),
+        "plugin_profile": [
+            {
+                "name": entry["name"],
+                "calls": entry["calls"],
+                "total_ms": round(entry["total_ms"], 2),
+                "self_ms": round(entry["self_ms"], 2),
+                "max_ms": round(entry["max_ms"], 2),
+            }
+            for entry in summary.get("plugin_profile") or []
+        ],
+        "profile_file": summary.get("profile_file"),
+    }
+
+
+def check_bounds(report: Dict[str, Any], args: argparse.Namespace) -> List[str]:
+    roots = report["settings"]["expected_roots"]
+    rss_mb_per_client = args.max_rss_mb_per_client
+    if rss_mb_per_client is None:
+        rss_mb_per_client = DEFAULT_RSS_MB_PER_CLIENT[report["settings"]["server"]]
+    bounds = {
+        "clients": args.max_clients if args.max_clients is not None else roots,
+        "server_processes": (args.max_clients or roots) * args.max_processes_per_client,
+        "server_rss_mb": (args.max_clients or roots) * rss_mb_per_client,
+        "fs_event_handles": args.max_fs_events if args.max_fs_events is not None else args.packages + 1,
+        "plugin_ui_ms_per_buffer": args.max_plugin_ms_per_buffer,
+    }
+    failures = [
+        f"{name} = {report[name]} exceeds bound {bound}"
+        for name, bound in bounds.items()
+        if report[name] is not None and report[name] > bound
+    ]
+    attach_p95 = report["attach_ms"]["p95"] if report["attach_ms"] else None
+    if attach_p95 is not None and attach_p95 > args.max_attach_p95_ms:
+        failures.append(f"attach_ms.p95 = {attach_p95} exceeds bound {args.max_attach_p95_ms}")
+    if report["attached"] != report["buffers"]:
+        failures.append(f"only {report['attached']} of {report['buffers']} buffers attached an eslint client")
+    if report["buffers"] and not (report["plugin_calls"] or {}).get("start_client_for_buffer"):
+        failures.append("the profiler recorded no start_client_for_buffer calls")
+    profile_file = Path(report["profile_file"]) if report["profile_file"] else None
+    if report["buffers"] and (profile_file is None or not profile_file.is_file() or not profile_file.read_text().strip()):
+        failures.append(f"the profiler wrote no collapsed stacks to {profile_file}")
+    if report["diagnosed"] != report["buffers"]:
+        failures.append(f"only {report['diagnosed']} of {report['buffers']} buffers received diagnostics")
+    report["bounds"] = dict(bounds, attach_p95_ms=args.max_attach_p95_ms)
+    return failures
+
+
+# --- Section: Entry point ---
+
+
+def parse_args(argv: List[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Scale benchmark for clients, watchers and memory across many roots.")
+    parser.add_argument("--packages", type=int, default=24, help="Package roots in the generated workspace.")
+    parser.add_argument("--files-per-package", type=int, default=10, help="Buffers opened per package.")
+    parser.add_argument("--lines-per-file", type=int, default=80, help="Approximate lines per generated file.")
+    parser.add_argument(
+        "--roots",
+        choices=("package", "git"),
+        default="package",
+        help="'package' omits the git repository so each package becomes its own client root.",
+    )
+    parser.add_argument(
+        "--server",
+        choices=("auto", "real", "fake"),
+        default="auto",
+        help="Language server to run; 'auto' uses the real one when the module store has ESLint.",
+    )
+    parser.add_argument("--node-modules", type=Path, default=default_module_store(), help="ESLint module store.")
+    parser.add_argument("--max-clients", type=int, help="Upper bound on eslint clients (default: number of roots).")
+    parser.add_argument("--max-processes-per-client", type=int, default=1, help="Server processes allowed per client.")
+    parser.add_argument(
+        "--max-rss-mb-per-client",
+        type=float,
+        help=f"Server RSS allowed per client (default: {DEFAULT_RSS_MB_PER_CLIENT['real']:g} for the real server, "
+        f"{DEFAULT_RSS_MB_PER_CLIENT['fake']:g} for the stand-in server).",
+    )
+    parser.add_argument("--max-fs-events", type=int, help="Upper bound on fs_event handles (default: packages + 1).")
+    parser.add_argument("--max-attach-p95-ms", type=float, default=1000.0, help="Bound on p95 time to attach.")
+    parser.add_argument(
+        "--max-plugin-ms-per-buffer",
+        type=float,
+        default=25.0,
+        help="Bound on UI-thread time spent in plugin code per opened buffer.",
+    )
+    parser.add_argument("--timeout", type=int, default=20000, help="Timeout (ms) to attach each buffer.")
+    parser.add_argument("--settle-ms", type=int, default=120000, help="Time to wait for every buffer's diagnostics.")
+    parser.add_argument("--nvim-cmd", default=os.environ.get("NVIM_COMMAND", "nvim"), help="Neovim executable.")
+    parser.add_argument("--init", default=str(DEFAULT_INIT), help="Neovim init file that loads the plugin.")
+    parser.add_argument("--driver", default=str(DEFAULT_DRIVER), help="Lua driver executed inside Neovim.")
+    parser.add_argument("--output", type=Path, help="Write the JSON report to this file as well as stdout.")
+    parser.add_argument(
+        "--profile-output",
+        type=Path,
+        help="Keep the plugin profile in collapsed-stack format at this path (default: a temporary file).",
+    )
+    return parser.parse_args(argv)
+
+
+def run(args: argparse.Namespace, workdir: Path) -> int:
+    store = args.node_modules.resolve() if args.node_modules else None
+    server = resolve_server(args, store)
+    files = generate_fixture(args, workdir / "fixture", store if server == "real" else None)
+    roots = args.packages if args.roots == "package" else 1
+
+    profile_file = args.profile_output.resolve() if args.profile_output else workdir / "plugin-profile.folded"
+    config: Dict[str, Any] = {"profile": {"file": str(profile_file)}}
+    if server == "fake":
+        config["cmd"] = [sys.executable, str(FAKE_SERVER), "--stdio"]
+    env = os.environ.copy()
+    env[CONFIG_ENV_VAR] = json.dumps(config)
+
+    files_json = workdir / "files.json"
+    files_json.write_text(json.dumps(files))
+    driver_expr = (
+        "lua local driver = dofile(%r); "
+        "local files = vim.json.decode(table.concat(vim.fn.readfile(%r), '\\n')); "
+        "assert(driver.run({ files = files, timeout = %d, settle_ms = %d }), 'multi-root driver failed')"
+    ) % (str(Path(args.driver).resolve()), str(files_json), args.timeout, args.settle_ms)
+    headless_cmd = shlex.split(args.nvim_cmd) + [
+        "--headless",
+        "-u",
+        str(Path(args.init).resolve()),
+        f"+{driver_expr}",
+        "+qa!",
+    ]
+
+    result = run_command(headless_cmd, cwd=REPO_ROOT, env=env)
+    if result.returncode != 0:
+        print("Headless Neovim run failed:", file=sys.stderr)
+        sys.stderr.write(result.stdout)
+        sys.stderr.write(result.stderr)
+        return result.returncode
+
+    summary = find_record(result.stdout or result.stderr, "summary")
+    if summary is None:
+        print("Missing summary in headless output", file=sys.stderr)
+        sys.stderr.write(result.stdout + result.stderr)
+        return 1
+
+    report = build_report(summary, args, server, roots)
+    failures = check_bounds(report, args)
+    text = json.dumps(report, indent=2)
+    print("=== Multi-root scale report ===")
+    print(text)
+    if args.output:
+        args.output.write_text(text + "\n")
+
+    if failures:
+        for failure in failures:
+            print(f"FAILURE: {failure}", file=sys.stderr)
+        return 1
+
+    print("All scale measurements are within bounds.")
+    return 0
+
+
+def main(argv: List[str] | None = None) -> int:
+    args = parse_args(argv)
+    with tempfile.TemporaryDirectory(prefix="nvim-eslint-scale-") as tmp:
+        try:
+            return run(args, Path(tmp))
+        except RuntimeError as exc:
+            print(exc, file=sys.stderr)
+            return 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
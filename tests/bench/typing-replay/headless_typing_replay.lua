@@ -0,0 +1,130 @@
+local M = {}
+
+local uv = vim.uv or vim.loop
+
+local script_dir = vim.fn.fnamemodify(debug.getinfo(1, "S").source:sub(2), ":p:h")
+local helpers = dofile(vim.fn.fnamemodify(script_dir, ":h") .. "/helpers.lua")
+local elapsed_ms = helpers.elapsed_ms
+local buffer_version = helpers.buffer_version
+
+-- Sums user+system CPU ticks of every process spawned below this Neovim
+-- (the language server and any wrapper). Returns nil where /proc is missing.
+local function child_cpu_ticks()
+  local total
+  local function visit(pid)
+    for _, child in ipairs(vim.api.nvim_get_proc_children(pid)) do
+      local fd = io.open("/proc/" .. child .. "/stat", "r")
+      if fd then
+        local stat = fd:read("*l") or ""
+        fd:close()
+        -- Fields after the parenthesized command name start at field 3 (state);
+        -- utime and stime are fields 14 and 15.
+        local fields = vim.split(stat:match("%) (.*)$") or "", " ", { plain = true })
+        local utime, stime = tonumber(fields[12]), tonumber(fields[13])
+        if utime and stime then
+          total = (total or 0) + utime + stime
+        end
+      end
+      visit(child)
+    end
+  end
+  visit(vim.fn.getpid())
+  return total
+end
+
+local function type_text(bufnr, cursor, text)
+  if text == "\b" then
+    if cursor.col > 0 then
+      vim.api.nvim_buf_set_text(bufnr, cursor.row, cursor.col - 1, cursor.row, cursor.col, { "" })
+      cursor.col = cursor.col - 1
+    end
+    return
+  end
+
+  local lines = vim.split(text, "\n", { plain = true })
+  vim.api.nvim_buf_set_text(bufnr, cursor.row, cursor.col, cursor.row, cursor.col, lines)
+  if #lines > 1 then
+    cursor.row = cursor.row + #lines - 1
+    cursor.col = #lines[#lines]
+  else
+    cursor.col = cursor.col + #lines[1]
+  end
+end
+
+function M.run(opts)
+  opts = opts or {}
+  local bufnr = opts.bufnr or vim.api.nvim_get_current_buf()
+  local timeout = opts.timeout or 20000
+  local settle_ms = opts.settle_ms or 5000
+  local events = helpers.read_json(opts.events_file)
+  local passes = helpers.track_lint_passes().of(bufnr)
+
+  if not vim.wait(timeout, function()
+    return helpers.eslint_client_attached(bufnr)
+  end, 10) then
+    vim.api.nvim_err_writeln("eslint LSP did not attach within timeout")
+    return false
+  end
+
+  -- Type on a fresh line at the end of the buffer once the initial lint settled.
+  local row = vim.api.nvim_buf_line_count(bufnr)
+  vim.api.nvim_buf_set_lines(bufnr, row, row, false, { "" })
+  local baseline = buffer_version(bufnr)
+  vim.wait(timeout, function()
+    local last = passes[#passes]
+    return last ~= nil and (last.version == nil or last.version >= baseline)
+  end, 10)
+
+  local cursor = { row = row, col = 0 }
+  local edits = {}
+  local cpu_before = child_cpu_ticks()
+  local start = uv.hrtime()
+  local first_pass = #passes + 1
+  local due = 0
+
+  for _, event in ipairs(events) do
+    due = due + (event.delay_ms or 0)
+    local remaining = due - elapsed_ms(start)
+    if remaining > 0 then
+      vim.wait(remaining)
+    end
+    type_text(bufnr, cursor, event.text or "")
+    table.insert(edits, {
+      version = buffer_version(bufnr),
+      at_ms = elapsed_ms(start),
+      due_ms = due,
+    })
+  end
+
+  local typing_ms = elapsed_ms(start)
+  local final_version = buffer_version(bufnr)
+  vim.wait(settle_ms, function()
+    local last = passes[#passes]
+    return #passes >= first_pass and (last.version == nil or last.version >= final_version)
+  end, 5)
+
+  local cpu_after = child_cpu_ticks()
+  local linted = {}
+  for index = first_pass, #passes do
+    local entry = passes[index]
+    table.insert(linted, {
+      at_ms = (entry.at - start) / 1e6,
+      version = entry.version == nil and vim.NIL or entry.version,
+      count = entry.count,
+      source = entry.source,
+    })
+  end
+
+  vim.api.nvim_out_write(vim.fn.json_encode({
+    type = "summary",
+    nvim_version = tostring(vim.version()),
+    typing_ms = typing_ms,
+    final_version = final_version,
+    edits = edits,
+    lint_passes = linted,
+    cpu_ticks = (cpu_before and cpu_after) and (cpu_after - cpu_before) or vim.NIL,
+  }) .. "\n")
+  return true
+end
+
+return M
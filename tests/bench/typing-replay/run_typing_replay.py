@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+"""Replay a keystroke stream into headless Neovim and measure lint lag.
+
+Each keystroke is applied to the buffer at the scheduled time. The harness then
+matches it with the first lint pass that covers its buffer version: a
+``textDocument/diagnostic`` response whose request was sent at or after that
+version (the bundled server only answers pull requests), or a
+``publishDiagnostics`` notification from a server that pushes. The report contains the lag distribution, the number of lint passes,
+the edits whose own version was never linted (superseded by a later pass), and
+the CPU time consumed by the server process tree. It is written as JSON so runs
+with different plugin settings or versions can be compared.
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import json
+import os
+import shlex
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List
+
+# --- Section: Constants ---
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+REPO_ROOT = SCRIPT_DIR.parents[2]
+DEFAULT_INIT = SCRIPT_DIR.parent / "headless_init.lua"
+DEFAULT_DRIVER = SCRIPT_DIR / "headless_typing_replay.lua"
+GENERATOR = REPO_ROOT / "tests" / "e2e" / "scale-fixture" / "generate_scale_fixture.py"
+FAKE_SERVER = REPO_ROOT / "tests" / "e2e" / "fake-server" / "fake_eslint_server.py"
+CONFIG_ENV_VAR = "NVIM_ESLINT_BENCH_CONFIG"
+DEFAULT_TEXT = 'const typedValue = Math.max(1, 2);\nconsole.log("typed", typedValue);\n'
+
+sys.path.insert(0, str(SCRIPT_DIR.parent))
+
+from bench_common import distribution, find_record, git_revision, run_command  # noqa: E402
+
+
+# --- Section: Keystroke streams ---
+
+
+def synthetic_events(text: str, keystrokes: int, cps: float) -> List[Dict[str, Any]]:
+    delay = 1000.0 / cps
+    return [{"delay_ms": delay, "text": char} for char in itertools.islice(itertools.cycle(text), keystrokes)]
+
+
+def load_events(path: Path) -> List[Dict[str, Any]]:
+    """Load a recorded stream: a JSON array of ``{"delay_ms": float, "text": str}``.
+
+    ``"\\b"`` as text deletes the character before the cursor.
+    """
+
+    events = json.loads(path.read_text())
+    if not isinstance(events, list):
+        raise ValueError(f"{path} must contain a JSON array of keystroke events")
+    return events
+
+
+# --- Section: Metrics ---
+
+
+def covers(lint_pass: Dict[str, Any], edit: Dict[str, Any]) -> bool:
+    if lint_pass["at_ms"] < edit["at_ms"]:
+        return False
+    return lint_pass["version"] is None or lint_pass["version"] >= edit["version"]
+
+
+def compute_metrics(summary: Dict[str, Any]) -> Dict[str, Any]:
+    edits = summary["edits"]
+    passes = summary["lint_passes"]
+    versioned = bool(passes) and all(lint_pass["version"] is not None for lint_pass in passes)
+    linted_versions = {lint_pass["version"] for lint_pass in passes}
+
+    lags: List[float] = []
+    unresolved = 0
+    for edit in edits:
+        covering = next((lint_pass for lint_pass in passes if covers(lint_pass, edit)), None)
+        if covering is None:
+            unresolved += 1
+        else:
+            lags.append(covering["at_ms"] - edit["at_ms"])
+
+    superseded = sum(1 for edit in edits if edit["version"] not in linted_versions) if versioned else None
+    cpu_ticks = summary.get("cpu_ticks")
+    clock_ticks = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+    return {
+        "edits": len(edits),
+        "typing_ms": round(summary["typing_ms"], 1),
+        "schedule_slip_ms": distribution([edit["at_ms"] - edit["due_ms"] for edit in edits]),
+        "lag_ms": distribution(lags),
+        "unresolved_edits": unresolved,
+        "lint_passes": len(passes),
+        "lint_pass_sources": sorted({lint_pass.get("source") or "push" for lint_pass in passes}),
+        "superseded_edits": superseded,
+        "versioned_passes": versioned,
+        "server_cpu_s": round(cpu_ticks / clock_ticks, 3) if isinstance(cpu_ticks, (int, float)) else None,
+    }
+
+
+# --- Section: Target preparation ---
+
+
+def generate_target(workdir: Path, lines: int, node_modules: str | None) -> Path:
+    fixture = workdir / "fixture"
+    command = [
+        sys.executable,
+        str(GENERATOR),
+        str(fixture),
+        "--packages",
+        "1",
+        "--files-per-package",
+        "1",
+        "--lines-per-file",
+        str(lines),
+        "--flat-ratio",
+        "1",
+    ]
+    if node_modules:
+        command += ["--node-modules", node_modules]
+    result = run_command(command)
+    if result.returncode != 0:
+        raise RuntimeError(f"Fixture generation failed:\n{result.stdout}{result.stderr}")
+    manifest = json.loads((fixture / "scale-fixture.json").read_text())
+    return fixture / manifest["packages"][0]["files"][0]["path"]
+
+
+def default_module_store() -> str | None:
+    fixture = os.environ.get("NVIM_ESLINT_FIXTURE")
+    return str(Path(fixture) / "node_modules") if fixture else None
+
+
+def plugin_config(args: argparse.Namespace) -> Dict[str, Any]:
+    config: Dict[str, Any] = {}
+    if args.settings:
+        config["settings"] = json.loads(args.settings)
+    if args.server == "fake":
+        config["cmd"] = [
+            sys.executable,
+            str(FAKE_SERVER),
+            "--stdio",
+            "--latency-ms",
+            str(args.fake_latency_ms),
+            "--jitter-ms",
+            str(args.fake_jitter_ms),
+        ]
+    return config
+
+
+# --- Section: Entry point ---
+
+
+def parse_args(argv: List[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Measure diagnostic lag while replaying keystrokes into a buffer.")
+    parser.add_argument("--target", help="File to type into. Defaults to a generated large TypeScript file.")
+    parser.add_argument(
+        "--fixture-root",
+        default=os.environ.get("NVIM_ESLINT_FIXTURE"),
+        help="Resolve a relative --target against this directory.",
+    )
+    parser.add_argument("--lines", type=int, default=3000, help="Size of the generated target file.")
+    parser.add_argument(
+        "--node-modules",
+        default=default_module_store(),
+        help="Module store linked into the generated fixture (default: $NVIM_ESLINT_FIXTURE/node_modules).",
+    )
+    parser.add_argument("--keystrokes-file", type=Path, help="Recorded stream: JSON array of {delay_ms, text}.")
+    parser.add_argument("--keystrokes", type=int, default=200, help="Synthetic keystrokes to replay.")
+    parser.add_argument("--cps", type=float, default=10.0, help="Synthetic typing rate in characters per second.")
+    parser.add_argument("--text", default=DEFAULT_TEXT, help="Text cycled through by the synthetic stream.")
+    parser.add_argument("--settings", help='Plugin settings overrides as JSON, e.g. \'{"quiet": true}\'.')
+    parser.add_argument("--server", choices=("real", "fake"), default="real", help="Language server to run against.")
+    parser.add_argument("--fake-latency-ms", type=float, default=50.0, help="Lint latency of the stand-in server.")
+    parser.add_argument("--fake-jitter-ms", type=float, default=0.0, help="Latency jitter of the stand-in server.")
+    parser.add_argument("--settle-ms", type=int, default=5000, help="Time to wait for the last edit to be linted.")
+    parser.add_argument("--timeout", type=int, default=20000, help="Timeout (ms) for attach and the initial lint.")
+    parser.add_argument("--nvim-cmd", default=os.environ.get("NVIM_COMMAND", "nvim"), help="Neovim executable.")
+    parser.add_argument("--init", default=str(DEFAULT_INIT), help="Neovim init file that loads the plugin.")
+    parser.add_argument("--driver", default=str(DEFAULT_DRIVER), help="Lua driver executed inside Neovim.")
+    parser.add_argument("--output", type=Path, help="Write the JSON report to this file as well as stdout.")
+    args = parser.parse_args(argv)
+    if args.cps <= 0:
+        parser.error("--cps must be positive")
+    return args
+
+
+def run(args: argparse.Namespace, workdir: Path) -> int:
+    if args.target:
+        target = Path(args.target)
+        if not target.is_absolute() and args.fixture_root:
+            target = Path(args.fixture_root) / target
+    else:
+        target = generate_target(workdir, args.lines, args.node_modules)
+    target = target.resolve()
+    if not target.exists():
+        print(f"Target file {target} does not exist", file=sys.stderr)
+        return 2
+
+    if args.keystrokes_file:
+        events = load_events(args.keystrokes_file)
+    else:
+        events = synthetic_events(args.text, args.keystrokes, args.cps)
+    events_file = workdir / "keystrokes.json"
+    events_file.write_text(json.dumps(events))
+
+    config = plugin_config(args)
+    env = os.environ.copy()
+    env[CONFIG_ENV_VAR] = json.dumps(config)
+
+    driver_opts = json.dumps({"events_file": str(events_file), "settle_ms": args.settle_ms, "timeout": args.timeout})
+    driver_expr = (
+        "lua local driver = dofile(%r); local opts = vim.fn.json_decode(%r); "
+        "assert(driver.run(opts), 'typing replay driver failed')"
+    ) % (str(Path(args.driver).resolve()), driver_opts)
+    headless_cmd = shlex.split(args.nvim_cmd) + [
+        "--headless",
+        "-u",
+        str(Path(args.init).resolve()),
+        str(target),
+        f"+{driver_expr}",
+        "+qa!",
+    ]
+
+    result = run_command(headless_cmd, cwd=REPO_ROOT, env=env)
+    if result.returncode != 0:
+        print("Headless Neovim run failed:", file=sys.stderr)
+        sys.stderr.write(result.stdout)
+        sys.stderr.write(result.stderr)
+        return result.returncode
+
+    summary = find_record(result.stdout or result.stderr, "summary")
+    if summary is None:
+        print("Missing summary in headless output", file=sys.stderr)
+        sys.stderr.write(result.stdout + result.stderr)
+        return 1
+
+    report = {
+        "plugin_revision": git_revision(REPO_ROOT),
+        "nvim_version": summary.get("nvim_version"),
+        "target": str(target),
+        "server": args.server,
+        "config": config,
+        "stream": {
+            "source": str(args.keystrokes_file) if args.keystrokes_file else "synthetic",
+            "keystrokes": len(events),
+            "cps": None if args.keystrokes_file else args.cps,
+        },
+        "metrics": compute_metrics(summary),
+    }
+    text = json.dumps(report, indent=2)
+    print(text)
+    if report["metrics"]["lint_passes"] == 0:
+        print("No lint pass reached Neovim while typing; the report is not valid.", file=sys.stderr)
+        return 1
+    if args.output:
+        args.output.write_text(text + "\n")
+    return 0
+
+
+def main(argv: List[str] | None = None) -> int:
+    args = parse_args(argv)
+    with tempfile.TemporaryDirectory(prefix="nvim-eslint-typing-") as tmp:
+        try:
+            return run(args, Path(tmp))
+        except (RuntimeError, ValueError) as exc:
+            print(exc, file=sys.stderr)
+            return 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,428 @@
+#!/usr/bin/env python3
+"""Deterministic stand-in for the ESLint language server.
+
+The server speaks LSP over stdio and is meant to be plugged into the plugin via
+``user_config.cmd``. Like ``eslintServer.js`` it answers ``initialize`` with a
+``diagnosticProvider``, asks the client for ``workspace/configuration``
+whenever a document is opened, keeps document text in sync from incremental
+``didChange`` notifications, and answers ``textDocument/diagnostic`` pull
+requests with scripted diagnostics after a configurable latency and jitter.
+``$/cancelRequest`` cancels a pending answer.
+
+``--push`` switches to push mode instead, for measuring clients of servers
+that push: no ``diagnosticProvider`` is advertised and diagnostics are
+published after each ``didOpen``/``didChange``. A newer document version then
+cancels a pending publish for the same document, like a lint pass being
+superseded.
+
+Every message exchanged with the client can be recorded as NDJSON so tests can
+assert request counts and measure client overhead without Node or ESLint.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import re
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+# --- Section: Constants ---
+
+# Patterns that match the snippets injected by tests/e2e/parity/seed_eslint_errors.py,
+# so generated fixtures produce the same number of diagnostics as the real server.
+DEFAULT_RULES: List[Dict[str, Any]] = [
+    {
+        "pattern": r"\bESLINT_ERROR_UNUSED\b",
+        "code": "@typescript-eslint/no-unused-vars",
+        "message": "'ESLINT_ERROR_UNUSED' is assigned a value but never used.",
+        "severity": 1,
+    },
+    {
+        "pattern": r":\s*any\b",
+        "code": "@typescript-eslint/no-explicit-any",
+        "message": "Unexpected any. Specify a different type.",
+        "severity": 1,
+    },
+    {
+        "pattern": r"\blet\s+\w+",
+        "code": "prefer-const",
+        "message": "This variable is never reassigned. Use 'const' instead.",
+        "severity": 1,
+    },
+    {
+        "pattern": r"\bconsole\.log\b",
+        "code": "no-console",
+        "message": "Unexpected console statement.",
+        "severity": 1,
+    },
+    {
+        "pattern": r"(?<![=!<>])==(?!=)",
+        "code": "eqeqeq",
+        "message": "Expected '===' and instead saw '=='.",
+        "severity": 1,
+    },
+]
+
+INCREMENTAL_SYNC = 2
+REQUEST_CANCELLED = -32800
+
+
+# --- Section: Recording ---
+
+
+class Recorder:
+    """Append one NDJSON line per observed event.
+
+    Every server process tags its lines with its own session, so a client that
+    restarts the server can share one recording.
+    """
+
+    def __init__(self, path: Path | None, *, payloads: bool) -> None:
+        self._handle = path.open("a", encoding="utf-8") if path else None
+        self._payloads = payloads
+        self._lock = threading.Lock()
+        self._session = f"{os.getpid()}-{int(time.time())}"
+
+    def message(self, direction: str, message: Dict[str, Any], size: int) -> None:
+        if "method" in message:
+            kind = "request" if "id" in message else "notification"
+        else:
+            kind = "response"
+        entry: Dict[str, Any] = {"direction": direction, "kind": kind, "size": size}
+        for key in ("id", "method"):
+            if key in message:
+                entry[key] = message[key]
+        if "error" in message:
+            entry["error"] = True
+        params = message.get("params")
+        if isinstance(params, dict):
+            document = params.get("textDocument", params)
+            if isinstance(document, dict) and "uri" in document:
+                entry["uri"] = document["uri"]
+                if document.get("version") is not None:
+                    entry["version"] = document["version"]
+        if self._payloads:
+            entry["payload"] = message
+        self.event("message", **entry)
+
+    def event(self, event: str, **fields: Any) -> None:
+        if not self._handle:
+            return
+        record = {"t": time.time(), "event": event, "session": self._session, **fields}
+        with self._lock:
+            self._handle.write(json.dumps(record) + "\n")
+            self._handle.flush()
+
+    def close(self) -> None:
+        if self._handle:
+            self._handle.close()
+
+
+# --- Section: Transport ---
+
+
+class Transport:
+    """Content-Length framed JSON-RPC over binary stdio."""
+
+    def __init__(self, recorder: Recorder) -> None:
+        self._stdin = sys.stdin.buffer
+        self._stdout = sys.stdout.buffer
+        self._lock = threading.Lock()
+        self._recorder = recorder
+
+    def read(self) -> Dict[str, Any] | None:
+        length = None
+        while True:
+            line = self._stdin.readline()
+            if not line:
+                return None
+            line = line.strip()
+            if not line:
+                break
+            name, _, value = line.decode("ascii").partition(":")
+            if name.lower() == "content-length":
+                length = int(value.strip())
+        if length is None:
+            return None
+        body = self._stdin.read(length)
+        message = json.loads(body)
+        self._recorder.message("recv", message, length)
+        return message
+
+    def write(self, message: Dict[str, Any]) -> None:
+        message = {"jsonrpc": "2.0", **message}
+        body = json.dumps(message).encode("utf-8")
+        with self._lock:
+            self._stdout.write(b"Content-Length: %d\r\n\r\n" % len(body))
+            self._stdout.write(body)
+            self._stdout.flush()
+        self._recorder.message("send", message, len(body))
+
+
+# --- Section: Documents ---
+
+
+def position_to_offset(text: str, position: Dict[str, int]) -> int:
+    """Translate an LSP position into a string offset (fixtures are ASCII, so
+    UTF-16 code units and characters coincide)."""
+
+    offset = 0
+    for _ in range(position["line"]):
+        newline = text.find("\n", offset)
+        if newline == -1:
+            return len(text)
+        offset = newline + 1
+    return min(offset + position["character"], len(text))
+
+
+def apply_change(text: str, change: Dict[str, Any]) -> str:
+    if "range" not in change:
+        return change["text"]
+    start = position_to_offset(text, change["range"]["start"])
+    end = position_to_offset(text, change["range"]["end"])
+    return text[:start] + change["text"] + text[end:]
+
+
+def lint(text: str, rules: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    diagnostics: List[Dict[str, Any]] = []
+    for line_number, line in enumerate(text.split("\n")):
+        for rule in rules:
+            for match in rule["regex"].finditer(line):
+                diagnostics.append(
+                    {
+                        "range": {
+                            "start": {"line": line_number, "character": match.start()},
+                            "end": {"line": line_number, "character": match.end()},
+                        },
+                        "severity": rule.get("severity", 1),
+                        "code": rule["code"],
+                        "source": "eslint",
+                        "message": rule["message"],
+                    }
+                )
+    return diagnostics
+
+
+# --- Section: Server ---
+
+
+class FakeEslintServer:
+    def __init__(self, args: argparse.Namespace, rules: List[Dict[str, Any]], recorder: Recorder) -> None:
+        self.args = args
+        self.rules = rules
+        self.recorder = recorder
+        self.transport = Transport(recorder)
+        self.random = random.Random(args.seed)
+        self.documents: Dict[str, Dict[str, Any]] = {}
+        self.pending_publish: Dict[str, threading.Timer] = {}
+        self.pending_pulls: Dict[Any, threading.Timer] = {}
+        self.pending_requests: Dict[int, Callable[[Dict[str, Any]], None]] = {}
+        self.next_request_id = 0
+        self.lock = threading.Lock()
+
+    # Outgoing traffic
+
+    def request(self, method: str, params: Any, on_result: Callable[[Dict[str, Any]], None]) -> None:
+        with self.lock:
+            self.next_request_id += 1
+            request_id = self.next_request_id
+            self.pending_requests[request_id] = on_result
+        self.transport.write({"id": request_id, "method": method, "params": params})
+
+    def delay(self) -> float:
+        jitter = self.random.uniform(-self.args.jitter_ms, self.args.jitter_ms) if self.args.jitter_ms else 0.0
+        return max(self.args.latency_ms + jitter, 0.0) / 1000
+
+    def schedule_publish(self, uri: str) -> None:
+        if not self.args.push:
+            return
+        with self.lock:
+            previous = self.pending_publish.pop(uri, None)
+            if previous is not None:
+                previous.cancel()
+                self.recorder.event("superseded", uri=uri)
+            timer = threading.Timer(self.delay(), self.publish, args=(uri,))
+            timer.daemon = True
+            self.pending_publish[uri] = timer
+        timer.start()
+
+    def publish(self, uri: str) -> None:
+        with self.lock:
+            self.pending_publish.pop(uri, None)
+            document = self.documents.get(uri)
+            if document is None:
+                return
+            text = document["text"]
+            version = document["version"]
+        diagnostics = lint(text, self.rules)
+        self.transport.write(
+            {
+                "method": "textDocument/publishDiagnostics",
+                "params": {"uri": uri, "version": version, "diagnostics": diagnostics},
+            }
+        )
+
+    def schedule_pull_answer(self, request_id: Any, uri: str) -> None:
+        with self.lock:
+            document = self.documents.get(uri)
+            text = document["text"] if document else ""
+            # Lint the text as of the request, like the real server does.
+            timer = threading.Timer(self.delay(), self.answer_pull, args=(request_id, text))
+            timer.daemon = True
+            self.pending_pulls[request_id] = timer
+        timer.start()
+
+    def answer_pull(self, request_id: Any, text: str) -> None:
+        with self.lock:
+            if self.pending_pulls.pop(request_id, None) is None:
+                return
+        items = lint(text, self.rules)
+        self.transport.write({"id": request_id, "result": {"kind": "full", "items": items}})
+
+    def cancel_pull(self, request_id: Any) -> None:
+        with self.lock:
+            timer = self.pending_pulls.pop(request_id, None)
+        if timer is None:
+            return
+        timer.cancel()
+        self.recorder.event("cancelled", id=request_id)
+        self.transport.write(
+            {"id": request_id, "error": {"code": REQUEST_CANCELLED, "message": "Request cancelled"}}
+        )
+
+    # Incoming traffic
+
+    def handle_request(self, message: Dict[str, Any]) -> None:
+        method = message["method"]
+        if method == "textDocument/diagnostic" and not self.args.push:
+            self.schedule_pull_answer(message["id"], message["params"]["textDocument"]["uri"])
+            return
+        if method == "initialize":
+            capabilities: Dict[str, Any] = {
+                "textDocumentSync": {"openClose": True, "change": INCREMENTAL_SYNC},
+                "workspace": {"workspaceFolders": {"supported": True}},
+            }
+            if not self.args.push:
+                capabilities["diagnosticProvider"] = {
+                    "identifier": "eslint",
+                    "interFileDependencies": False,
+                    "workspaceDiagnostics": False,
+                }
+            result: Any = {"capabilities": capabilities, "serverInfo": {"name": "fake-eslint-server"}}
+        else:
+            result = None
+        self.transport.write({"id": message["id"], "result": result})
+
+    def handle_notification(self, message: Dict[str, Any]) -> bool:
+        method = message["method"]
+        params = message.get("params") or {}
+        if method == "exit":
+            return False
+        if method == "$/cancelRequest":
+            self.cancel_pull(params.get("id"))
+        elif method == "textDocument/didOpen":
+            document = params["textDocument"]
+            uri = document["uri"]
+            with self.lock:
+                self.documents[uri] = {"text": document["text"], "version": document.get("version", 0)}
+            if self.args.configuration_request:
+                self.request(
+                    "workspace/configuration",
+                    {"items": [{"scopeUri": uri, "section": ""}]},
+                    lambda _response, uri=uri: self.schedule_publish(uri),
+                )
+            else:
+                self.schedule_publish(uri)
+        elif method == "textDocument/didChange":
+            document = params["textDocument"]
+            uri = document["uri"]
+            with self.lock:
+                current = self.documents.get(uri)
+                if current is None:
+                    return True
+                for change in params.get("contentChanges", []):
+                    current["text"] = apply_change(current["text"], change)
+                current["version"] = document.get("version", current["version"])
+            self.schedule_publish(uri)
+        elif method == "textDocument/didClose":
+            uri = params["textDocument"]["uri"]
+            with self.lock:
+                self.documents.pop(uri, None)
+                timer = self.pending_publish.pop(uri, None)
+            if timer is not None:
+                timer.cancel()
+        return True
+
+    def handle_response(self, message: Dict[str, Any]) -> None:
+        with self.lock:
+            callback = self.pending_requests.pop(message.get("id"), None)
+        if callback is not None:
+            callback(message)
+
+    def serve(self) -> int:
+        while True:
+            message = self.transport.read()
+            if message is None:
+                return 0
+            if "method" not in message:
+                self.handle_response(message)
+            elif "id" in message:
+                self.handle_request(message)
+            elif not self.handle_notification(message):
+                return 0
+
+
+# --- Section: Entry point ---
+
+
+def load_rules(script: Path | None) -> List[Dict[str, Any]]:
+    rules = DEFAULT_RULES
+    if script is not None:
+        rules = json.loads(script.read_text())["rules"]
+    return [dict(rule, regex=re.compile(rule["pattern"])) for rule in rules]
+
+
+def parse_args(argv: List[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Stand-in ESLint language server with scripted diagnostics.")
+    parser.add_argument("--stdio", action="store_true", help="Accepted for command-line parity with eslintServer.js.")
+    parser.add_argument("--latency-ms", type=float, default=50.0, help="Delay before diagnostics are returned.")
+    parser.add_argument(
+        "--push",
+        action="store_true",
+        help="Publish diagnostics after each change instead of answering textDocument/diagnostic requests.",
+    )
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="Uniform +/- jitter added to the latency.")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed for the jitter.")
+    parser.add_argument(
+        "--script",
+        type=Path,
+        help='JSON file with {"rules": [{"pattern", "code", "message", "severity"}]} replacing the default rules.',
+    )
+    parser.add_argument("--record", type=Path, help="Append every message sent or received as NDJSON to this file.")
+    parser.add_argument("--record-payloads", action="store_true", help="Include full message bodies in the record.")
+    parser.add_argument(
+        "--no-configuration-request",
+        dest="configuration_request",
+        action="store_false",
+        help="Skip the workspace/configuration round-trip on didOpen.",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: List[str] | None = None) -> int:
+    args = parse_args(argv)
+    recorder = Recorder(args.record, payloads=args.record_payloads)
+    try:
+        return FakeEslintServer(args, load_rules(args.script), recorder).serve()
+    finally:
+        recorder.close()
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
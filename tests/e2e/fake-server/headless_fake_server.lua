@@ -0,0 +1,172 @@
+local M = {}
+
+local uv = vim.uv or vim.loop
+
+local script_dir = vim.fn.fnamemodify(debug.getinfo(1, "S").source:sub(2), ":p:h")
+local helpers = dofile(vim.fn.fnamemodify(script_dir, ":h:h") .. "/bench/helpers.lua")
+
+local function wait_all(buffers, timeout, predicate)
+  return vim.wait(timeout, function()
+    for _, bufnr in ipairs(buffers) do
+      if not predicate(bufnr) then
+        return false
+      end
+    end
+    return true
+  end, 1)
+end
+
+-- Rewrites a watched config file and measures the restart it triggers: time
+-- until every buffer is attached to the new client, time until each of them
+-- has been linted by it, and the watcher registrations afterwards. The runner
+-- checks the recording and `clients_started` for exactly one restart.
+local function restart_on_config_change(opts, buffers, lint_passes, clients_started)
+  local watchers = require("nvim-eslint.watchers")
+  local timeout = opts.timeout or 10000
+  local previous = {}
+  for _, client in ipairs(vim.lsp.get_clients({ name = "eslint" })) do
+    previous[client.id] = true
+  end
+
+  local result = { config_file = opts.config_file, watchers_before = watchers.stats() }
+  local reattached = {}
+  vim.api.nvim_create_autocmd("LspAttach", {
+    group = vim.api.nvim_create_augroup("nvim-eslint-fake-server-restart", { clear = true }),
+    callback = function(args)
+      local client = vim.lsp.get_client_by_id(args.data.client_id)
+      if client and client.name == "eslint" and not previous[client.id] then
+        reattached[args.buf] = reattached[args.buf] or uv.hrtime()
+      end
+    end,
+  })
+
+  local start = uv.hrtime()
+  local lines = vim.fn.readfile(opts.config_file)
+  table.insert(lines, "")
+  vim.fn.writefile(lines, opts.config_file)
+
+  if wait_all(buffers, timeout, function(bufnr)
+    return reattached[bufnr] ~= nil
+  end) then
+    local last = start
+    for _, bufnr in ipairs(buffers) do
+      last = math.max(last, reattached[bufnr])
+    end
+    result.restart_ms = (last - start) / 1e6
+  end
+
+  local function relinted(bufnr)
+    for _, pass in ipairs(lint_passes.of(bufnr)) do
+      if reattached[bufnr] and pass.at >= reattached[bufnr] then
+        return pass
+      end
+    end
+  end
+  if wait_all(buffers, timeout, function(bufnr)
+    return relinted(bufnr) ~= nil
+  end) then
+    local last = start
+    result.diagnostics = {}
+    for index, bufnr in ipairs(buffers) do
+      local passes = lint_passes.of(bufnr)
+      last = math.max(last, relinted(bufnr).at)
+      result.diagnostics[opts.files[index]] = passes[#passes].count
+    end
+    result.diagnostics_ms = (last - start) / 1e6
+  end
+
+  -- Let the stopped client exit, then give late file events time to trigger
+  -- a second restart if the plugin were going to.
+  vim.wait(timeout, function()
+    return watchers.stats().clients <= 1
+  end, 10)
+  vim.wait(opts.settle_ms or 500, function()
+    return false
+  end, 50)
+
+  result.buffers_reattached = vim.tbl_count(reattached)
+  result.clients_started = vim.tbl_count(clients_started)
+  result.watchers_after = watchers.stats()
+  return result
+end
+
+function M.run(opts)
+  opts = opts or {}
+  local files = opts.files or {}
+  local edits = opts.edits or 0
+  local timeout = opts.timeout or 10000
+  local lint_passes = helpers.track_lint_passes()
+  local clients_started = {}
+  vim.api.nvim_create_autocmd("LspAttach", {
+    group = vim.api.nvim_create_augroup("nvim-eslint-fake-server-clients", { clear = true }),
+    callback = function(args)
+      local client = vim.lsp.get_client_by_id(args.data.client_id)
+      if client and client.name == "eslint" then
+        clients_started[client.id] = true
+      end
+    end,
+  })
+
+  local summary = {
+    type = "summary",
+    buffers = {},
+    edits = {},
+  }
+
+  local bufnr
+  local buffers = {}
+  for _, path in ipairs(files) do
+    local start = uv.hrtime()
+    vim.cmd.edit(vim.fn.fnameescape(path))
+    bufnr = vim.api.nvim_get_current_buf()
+    table.insert(buffers, bufnr)
+
+    local entry = { path = path }
+    if vim.wait(timeout, function()
+      return helpers.eslint_client_attached(bufnr)
+    end, 1) then
+      entry.attach_ms = helpers.elapsed_ms(start)
+    end
+
+    local passes = lint_passes.of(bufnr)
+    if vim.wait(timeout, function()
+      return #passes > 0
+    end, 1) then
+      entry.first_diagnostics_ms = (passes[1].at - start) / 1e6
+      entry.diagnostics = passes[#passes].count
+    end
+
+    table.insert(summary.buffers, entry)
+  end
+
+  for index = 1, (bufnr and edits or 0) do
+    local start = uv.hrtime()
+    local line_count = vim.api.nvim_buf_line_count(bufnr)
+    vim.api.nvim_buf_set_lines(bufnr, line_count, line_count, false, {
+      ('console.log("fake server edit %d");'):format(index),
+    })
+    local version = helpers.buffer_version(bufnr)
+
+    local passes = lint_passes.of(bufnr)
+    local entry = { version = version }
+    if vim.wait(timeout, function()
+      local last = passes[#passes]
+      return last ~= nil and last.version ~= nil and last.version >= version
+    end, 1) then
+      entry.latency_ms = (passes[#passes].at - start) / 1e6
+      entry.diagnostics = passes[#passes].count
+    end
+
+    table.insert(summary.edits, entry)
+  end
+
+  if bufnr and opts.config_file then
+    summary.restart = restart_on_config_change(opts, buffers, lint_passes, clients_started)
+  end
+
+  summary.clients = #vim.lsp.get_clients({ name = "eslint" })
+  vim.api.nvim_out_write(vim.fn.json_encode(summary) .. "\n")
+  return true
+end
+
+return M
@@ -0,0 +1,400 @@
+#!/usr/bin/env python3
+"""Measure plugin-side LSP behavior against the stand-in ESLint server.
+
+The suite generates a small synthetic monorepo, starts headless Neovim with
+``fake_eslint_server.py`` as the plugin's ``cmd``, opens every generated file,
+applies a few edits, rewrites a package's ESLint config to trigger a client
+restart, and then asserts request counts from the server's recording. Timings
+are reported relative to the server's scripted latency so the remainder is
+client overhead. No Node, pnpm, or ESLint install is needed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import shlex
+import sys
+import tempfile
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, List
+
+# --- Section: Constants ---
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+REPO_ROOT = SCRIPT_DIR.parents[2]
+BENCH_DIR = REPO_ROOT / "tests" / "bench"
+FAKE_SERVER = SCRIPT_DIR / "fake_eslint_server.py"
+DEFAULT_INIT = BENCH_DIR / "headless_init.lua"
+DEFAULT_DRIVER = SCRIPT_DIR / "headless_fake_server.lua"
+PULL_DIAGNOSTICS = "textDocument/diagnostic"
+SCALE_FIXTURE_DIR = SCRIPT_DIR.parent / "scale-fixture"
+GENERATOR = SCALE_FIXTURE_DIR / "generate_scale_fixture.py"
+CONFIG_ENV_VAR = "NVIM_ESLINT_BENCH_CONFIG"
+
+sys.path.insert(0, str(BENCH_DIR))
+sys.path.insert(0, str(SCALE_FIXTURE_DIR))
+
+from bench_common import distribution, find_record, parse_json_lines, run_command  # noqa: E402
+from generate_scale_fixture import FLAT_CONFIG_NAME, LEGACY_CONFIG_NAME, MANIFEST_NAME  # noqa: E402
+
+
+# --- Section: Output parsing ---
+
+
+def load_recording(path: Path) -> List[Dict[str, Any]]:
+    if not path.exists():
+        return []
+    return parse_json_lines(path.read_text())
+
+
+# --- Section: Reporting ---
+
+
+def summarize_recording(events: List[Dict[str, Any]]) -> Dict[str, Any]:
+    received: Counter[str] = Counter()
+    sent: Counter[str] = Counter()
+    per_uri: Dict[str, Counter[str]] = {}
+    sessions = set()
+    # Request ids restart with every client, so pulls are keyed per session.
+    pulls: Dict[Any, str] = {}
+    pull_answers: Counter[str] = Counter()
+    responses = 0
+    for event in events:
+        if event.get("event") in ("superseded", "cancelled"):
+            sent[event["event"]] += 1
+            continue
+        if event.get("event") != "message":
+            continue
+        session = event.get("session")
+        sessions.add(session)
+        if event["direction"] == "recv":
+            if event["kind"] == "response":
+                responses += 1
+                continue
+            received[event["method"]] += 1
+            if "uri" in event:
+                per_uri.setdefault(event["uri"], Counter())[event["method"]] += 1
+            if event["method"] == PULL_DIAGNOSTICS:
+                pulls[(session, event.get("id"))] = event.get("uri")
+        elif event["kind"] != "response":
+            sent[event["method"]] += 1
+        elif (session, event.get("id")) in pulls:
+            pull_answers["cancelled" if event.get("error") else "answered"] += 1
+    return {
+        "sessions": len(sessions),
+        "received": dict(received),
+        "sent": dict(sent),
+        "responses_received": responses,
+        "pull_requests": len(pulls),
+        "pull_answers": dict(pull_answers),
+        "pull_requests_per_buffer": {uri: counter[PULL_DIAGNOSTICS] for uri, counter in sorted(per_uri.items())},
+        "did_open_per_buffer": {uri: counter["textDocument/didOpen"] for uri, counter in sorted(per_uri.items())},
+        "max_requests_per_buffer": max((sum(counter.values()) for counter in per_uri.values()), default=0),
+    }
+
+
+def expected_diagnostics(fixture: Path) -> Dict[str, int]:
+    manifest = json.loads((fixture / MANIFEST_NAME).read_text())
+    expected: Dict[str, int] = {}
+    for package in manifest["packages"]:
+        for entry in package["files"]:
+            expected[str(fixture / entry["path"])] = sum(entry["violations"].values())
+    return expected
+
+
+def watched_config(fixture: Path) -> Path:
+    """Return the ESLint config of the first package, which the plugin watches once its files are open."""
+
+    package = json.loads((fixture / MANIFEST_NAME).read_text())["packages"][0]
+    name = FLAT_CONFIG_NAME if package["config"] == "flat" else LEGACY_CONFIG_NAME
+    return fixture / package["dir"] / name
+
+
+# --- Section: Assertions ---
+
+
+def check_pulls(recording: Dict[str, Any], expected: Dict[str, int], edited: str | None, push: bool) -> List[str]:
+    failures: List[str] = []
+    pulls = recording["pull_requests"]
+    if push:
+        if pulls:
+            failures.append(f"client sent {pulls} {PULL_DIAGNOSTICS} requests to a server without diagnosticProvider")
+        return failures
+
+    per_buffer = recording["pull_requests_per_buffer"]
+    for path in expected:
+        if per_buffer.get(Path(path).as_uri(), 0) < 1:
+            failures.append(f"no {PULL_DIAGNOSTICS} request for {path}")
+    if edited and per_buffer.get(Path(edited).as_uri(), 0) < 2:
+        failures.append(f"no {PULL_DIAGNOSTICS} request after editing {edited}")
+
+    # The client pulls after each didOpen/didChange it sends, and may pull once
+    # more when a buffer attaches; anything beyond that is redundant traffic.
+    received = recording["received"]
+    limit = 2 * received.get("textDocument/didOpen", 0) + received.get("textDocument/didChange", 0)
+    if pulls > limit:
+        failures.append(f"expected at most {limit} {PULL_DIAGNOSTICS} requests, saw {pulls}")
+    settled = sum(recording["pull_answers"].values())
+    if settled != pulls:
+        failures.append(f"server settled {settled} of {pulls} {PULL_DIAGNOSTICS} requests")
+    return failures
+
+
+def check_restart(summary: Dict[str, Any], recording: Dict[str, Any], expected: Dict[str, int]) -> List[str]:
+    """Assert that one config rewrite caused exactly one restart that reattached every buffer."""
+
+    restart = summary.get("restart")
+    if restart is None:
+        return ["the driver did not rewrite the config file"]
+
+    failures: List[str] = []
+    if restart.get("clients_started") != 2:
+        failures.append(f"expected exactly one restart (2 eslint clients), saw {restart.get('clients_started')} clients")
+    if recording["sessions"] != 2:
+        failures.append(f"expected 2 server processes in the recording, saw {recording['sessions']}")
+    if restart.get("buffers_reattached") != len(expected):
+        failures.append(f"only {restart.get('buffers_reattached')} of {len(expected)} buffers reattached after restart")
+    for path in expected:
+        opened = recording["did_open_per_buffer"].get(Path(path).as_uri(), 0)
+        if opened != 2:
+            failures.append(f"expected didOpen for {path} once per client, saw {opened}")
+    if "restart_ms" not in restart:
+        failures.append(f"buffers did not reattach after rewriting {restart.get('config_file')}")
+    if "diagnostics_ms" not in restart:
+        failures.append("not every buffer was linted by the restarted client")
+    else:
+        for path, count in restart["diagnostics"].items():
+            if count != expected.get(path):
+                failures.append(f"{path}: expected {expected.get(path)} diagnostics after restart, saw {count}")
+    if restart.get("watchers_after") != restart.get("watchers_before"):
+        failures.append(
+            f"watchers were not re-registered: {restart.get('watchers_before')} before, "
+            f"{restart.get('watchers_after')} after restart"
+        )
+    return failures
+
+
+def check(
+    summary: Dict[str, Any],
+    recording: Dict[str, Any],
+    expected: Dict[str, int],
+    edits: int,
+    push: bool,
+    restart: bool,
+) -> List[str]:
+    failures: List[str] = []
+    received = recording["received"]
+    sent = recording["sent"]
+    clients = 2 if restart else 1
+
+    if received.get("initialize") != clients:
+        failures.append(f"expected {clients} initialize request(s), saw {received.get('initialize', 0)}")
+    if summary.get("clients") != 1:
+        failures.append(f"expected one eslint client for a single git root, saw {summary.get('clients')}")
+    if received.get("textDocument/didOpen") != clients * len(expected):
+        failures.append(
+            f"expected {clients * len(expected)} didOpen notifications, "
+            f"saw {received.get('textDocument/didOpen', 0)}"
+        )
+    config_requests = sent.get("workspace/configuration", 0)
+    if recording["responses_received"] != config_requests:
+        failures.append(
+            f"client answered {recording['responses_received']} of {config_requests} workspace/configuration requests"
+        )
+    changes = received.get("textDocument/didChange", 0)
+    if edits and not 1 <= changes <= edits:
+        failures.append(f"expected between 1 and {edits} didChange notifications, saw {changes}")
+
+    buffers = summary.get("buffers", [])
+    edited = buffers[-1]["path"] if edits and buffers else None
+    failures += check_pulls(recording, expected, edited, push)
+
+    for buffer in buffers:
+        path = buffer["path"]
+        if "first_diagnostics_ms" not in buffer:
+            failures.append(f"no diagnostics received for {path}")
+        elif buffer.get("diagnostics") != expected.get(path):
+            failures.append(f"{path}: expected {expected.get(path)} diagnostics, saw {buffer.get('diagnostics')}")
+    for index, edit in enumerate(summary.get("edits", []), start=1):
+        if "latency_ms" not in edit:
+            failures.append(f"edit {index} (version {edit.get('version')}) never received diagnostics")
+    if restart:
+        failures += check_restart(summary, recording, expected)
+    return failures
+
+
+# --- Section: Entry point ---
+
+
+def parse_args(argv: List[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Run the plugin against the stand-in ESLint server and assert client request counts.",
+    )
+    parser.add_argument("--nvim-cmd", default=os.environ.get("NVIM_COMMAND", "nvim"), help="Neovim executable.")
+    parser.add_argument("--packages", type=int, default=3, help="Packages in the generated workspace.")
+    parser.add_argument("--files-per-package", type=int, default=4, help="Files opened per package.")
+    parser.add_argument("--lines-per-file", type=int, default=120, help="Approximate lines per generated file.")
+    parser.add_argument("--edits", type=int, default=5, help="Edits applied to the last opened buffer.")
+    parser.add_argument("--latency-ms", type=float, default=50.0, help="Scripted server lint latency.")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="Scripted +/- latency jitter.")
+    parser.add_argument(
+        "--push",
+        action="store_true",
+        help="Run the stand-in server in push mode instead of answering textDocument/diagnostic requests.",
+    )
+    parser.add_argument(
+        "--skip-restart",
+        action="store_true",
+        help="Do not rewrite a package's ESLint config to measure the client restart it triggers.",
+    )
+    parser.add_argument(
+        "--settle-ms",
+        type=int,
+        default=500,
+        help="Quiet period after the restart in which no further restart may happen.",
+    )
+    parser.add_argument("--timeout", type=int, default=10000, help="Timeout (ms) for each wait inside Neovim.")
+    parser.add_argument("--workspace", type=Path, help="Directory for the generated workspace (default: temporary).")
+    parser.add_argument("--output", type=Path, help="Write the JSON report to this file as well as stdout.")
+    parser.add_argument("--init", default=str(DEFAULT_INIT), help="Neovim init file that loads the plugin.")
+    parser.add_argument("--driver", default=str(DEFAULT_DRIVER), help="Lua driver executed inside Neovim.")
+    return parser.parse_args(argv)
+
+
+def run(args: argparse.Namespace, workdir: Path) -> int:
+    fixture = (args.workspace or workdir / "workspace").resolve()
+    record_path = workdir / "fake-server-record.ndjson"
+
+    generated = run_command(
+        [
+            sys.executable,
+            str(GENERATOR),
+            str(fixture),
+            "--force",
+            "--packages",
+            str(args.packages),
+            "--files-per-package",
+            str(args.files_per_package),
+            "--lines-per-file",
+            str(args.lines_per_file),
+        ]
+    )
+    if generated.returncode != 0:
+        print("Fixture generation failed:", file=sys.stderr)
+        sys.stderr.write(generated.stdout + generated.stderr)
+        return generated.returncode
+
+    expected = expected_diagnostics(fixture)
+    server_cmd = [
+        sys.executable,
+        str(FAKE_SERVER),
+        "--stdio",
+        "--latency-ms",
+        str(args.latency_ms),
+        "--jitter-ms",
+        str(args.jitter_ms),
+        "--record",
+        str(record_path),
+    ]
+    if args.push:
+        server_cmd.append("--push")
+    env = os.environ.copy()
+    env[CONFIG_ENV_VAR] = json.dumps({"cmd": server_cmd})
+
+    restart = not args.skip_restart
+    driver_opts = json.dumps(
+        {
+            "files": sorted(expected),
+            "edits": args.edits,
+            "timeout": args.timeout,
+            "config_file": str(watched_config(fixture)) if restart else None,
+            "settle_ms": args.settle_ms,
+        }
+    )
+    driver_expr = (
+        "lua local driver = dofile(%r); local opts = vim.fn.json_decode(%r); "
+        "assert(driver.run(opts), 'fake server driver failed')"
+    ) % (str(Path(args.driver).resolve()), driver_opts)
+    headless_cmd = shlex.split(args.nvim_cmd) + [
+        "--headless",
+        "-u",
+        str(Path(args.init).resolve()),
+        f"+{driver_expr}",
+        "+qa",
+    ]
+
+    result = run_command(headless_cmd, cwd=REPO_ROOT, env=env)
+    if result.returncode != 0:
+        print("Headless Neovim run failed:", file=sys.stderr)
+        sys.stderr.write(result.stdout)
+        sys.stderr.write(result.stderr)
+        return result.returncode
+
+    output = result.stdout or result.stderr
+    try:
+        summary = find_record(output, "summary")
+    except ValueError:
+        summary = None
+    if summary is None:
+        print("Missing summary in headless output", file=sys.stderr)
+        sys.stderr.write(output)
+        return 1
+
+    recording = summarize_recording(load_recording(record_path))
+    overhead = [
+        buffer["first_diagnostics_ms"] - args.latency_ms
+        for buffer in summary["buffers"]
+        if "first_diagnostics_ms" in buffer
+    ]
+    report = {
+        "settings": {
+            "files": len(expected),
+            "edits": args.edits,
+            "latency_ms": args.latency_ms,
+            "jitter_ms": args.jitter_ms,
+            "diagnostics": "push" if args.push else "pull",
+            "restart": restart,
+        },
+        "requests": recording,
+        "clients": summary.get("clients"),
+        "attach_ms": distribution([buffer["attach_ms"] for buffer in summary["buffers"] if "attach_ms" in buffer]),
+        "first_diagnostics_ms": distribution(
+            [buffer["first_diagnostics_ms"] for buffer in summary["buffers"] if "first_diagnostics_ms" in buffer]
+        ),
+        "client_overhead_ms": distribution(overhead),
+        "edit_latency_ms": distribution([edit["latency_ms"] for edit in summary["edits"] if "latency_ms" in edit]),
+        "restart": {
+            key: summary["restart"].get(key)
+            for key in ("config_file", "restart_ms", "diagnostics_ms", "clients_started", "watchers_after")
+        }
+        if summary.get("restart")
+        else None,
+    }
+
+    text = json.dumps(report, indent=2)
+    print("=== Stand-in server report ===")
+    print(text)
+    if args.output:
+        args.output.write_text(text + "\n")
+
+    failures = check(summary, recording, expected, args.edits, args.push, restart)
+    if failures:
+        for failure in failures:
+            print(f"FAILURE: {failure}", file=sys.stderr)
+        return 1
+
+    print("Stand-in server request counts matched expectations.")
+    return 0
+
+
+def main(argv: List[str] | None = None) -> int:
+    args = parse_args(argv)
+    with tempfile.TemporaryDirectory(prefix="nvim-eslint-fake-") as tmp:
+        return run(args, Path(tmp))
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,40 @@
+// ESLint formatter that mirrors the NDJSON records emitted by headless_collect.lua.
+// Usage: eslint --format /abs/path/to/ndjson_formatter.cjs <files>
+"use strict";
+
+const orNull = (value) => (value === undefined ? null : value);
+
+module.exports = function formatNdjson(results) {
+  const lines = [];
+
+  for (const result of results) {
+    for (const message of result.messages) {
+      lines.push(
+        JSON.stringify({
+          type: "message",
+          filePath: result.filePath,
+          ruleId: orNull(message.ruleId),
+          severity: message.severity,
+          message: message.message,
+          line: orNull(message.line),
+          column: orNull(message.column),
+          endLine: orNull(message.endLine),
+          endColumn: orNull(message.endColumn),
+          messageId: orNull(message.messageId),
+        }),
+      );
+    }
+
+    lines.push(
+      JSON.stringify({
+        type: "file",
+        filePath: result.filePath,
+        errorCount: result.errorCount,
+        warningCount: result.warningCount,
+      }),
+    );
+  }
+
+  lines.push(JSON.stringify({ type: "end" }));
+  return lines.join("\n") + "\n";
+};
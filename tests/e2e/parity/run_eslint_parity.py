@@ -8,58 +8,140 @@ import json
 import shlex
 import subprocess
 import sys
+from collections import Counter
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 
 SCRIPT_DIR = Path(__file__).resolve().parent
 REPO_ROOT = SCRIPT_DIR.parents[2]
 DEFAULT_INIT = SCRIPT_DIR / "headless_init.lua"
 DEFAULT_COLLECTOR = SCRIPT_DIR / "headless_collect.lua"
-
-
-def run_command(command: List[str], *, cwd: Path | None = None) -> subprocess.CompletedProcess[str]:
-    return subprocess.run(command, cwd=cwd, text=True, capture_output=True)
-
-
-def load_json(output: str, *, label: str) -> Any:
-    text = output.strip()
-    if not text:
-        raise ValueError(f"{label} produced no JSON output")
-    try:
-        return json.loads(text)
-    except json.JSONDecodeError as exc:
-        raise ValueError(f"Failed to parse {label} JSON: {exc}\nRaw output:\n{text}") from exc
-
-
-def canonicalize(results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    canonical: List[Dict[str, Any]] = []
-    for entry in results:
-        messages = []
-        for message in entry.get("messages", []):
-            messages.append(
-                {
-                    "ruleId": message.get("ruleId"),
-                    "severity": message.get("severity"),
-                    "message": message.get("message"),
-                    "line": message.get("line"),
-                    "column": message.get("column"),
-                    "endLine": message.get("endLine"),
-                    "endColumn": message.get("endColumn"),
-                }
-            )
-        messages.sort(key=lambda item: (item.get("line"), item.get("column"), item.get("ruleId"), item.get("message")))
-        error_count = sum(1 for msg in messages if msg.get("severity") == 2)
-        warning_count = sum(1 for msg in messages if msg.get("severity") != 2)
-        canonical.append(
-            {
-                "filePath": entry.get("filePath"),
-                "messages": messages,
-                "errorCount": entry.get("errorCount", error_count),
-                "warningCount": entry.get("warningCount", warning_count),
+DEFAULT_FORMATTER = SCRIPT_DIR / "ndjson_formatter.cjs"
+
+MESSAGE_FIELDS = ("ruleId", "severity", "message", "line", "column", "endLine", "endColumn")
+MAX_NOISE_LINES = 50
+
+MessageKey = Tuple[Any, ...]
+
+
+class RecordSummary:
+    """Incrementally aggregated NDJSON diagnostics for one producer."""
+
+    def __init__(self, label: str) -> None:
+        self.label = label
+        self.messages: Dict[str, Counter[MessageKey]] = {}
+        self.counts: Dict[str, Dict[str, int]] = {}
+        self.sources: Dict[str, str] = {}
+        self.message_total = 0
+        self.ended = False
+        self.noise: List[str] = []
+        self.returncode = 0
+
+    def add(self, record: Dict[str, Any]) -> None:
+        kind = record.get("type")
+        file_path = record.get("filePath")
+        if kind == "message":
+            key = tuple(record.get(field) for field in MESSAGE_FIELDS)
+            self.messages.setdefault(file_path, Counter())[key] += 1
+            self.message_total += 1
+        elif kind == "file":
+            self.messages.setdefault(file_path, Counter())
+            self.counts[file_path] = {
+                "errorCount": record.get("errorCount", 0),
+                "warningCount": record.get("warningCount", 0),
             }
-        )
-    canonical.sort(key=lambda item: item.get("filePath"))
-    return canonical
+            if "source" in record:
+                self.sources[file_path] = record["source"]
+        elif kind == "end":
+            self.ended = True
+
+    def feed(self, line: str) -> None:
+        text = line.strip()
+        if not text:
+            return
+        if text.startswith("{"):
+            try:
+                self.add(json.loads(text))
+                return
+            except json.JSONDecodeError:
+                pass
+        if len(self.noise) < MAX_NOISE_LINES:
+            self.noise.append(text)
+
+    def report_noise(self) -> None:
+        for line in self.noise:
+            print(f"[{self.label}] {line}", file=sys.stderr)
+
+
+def stream_records(command: List[str], summary: RecordSummary, *, cwd: Path | None = None) -> RecordSummary:
+    """Run ``command`` and feed its output into ``summary`` line by line."""
+
+    process = subprocess.Popen(
+        command,
+        cwd=cwd,
+        text=True,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        bufsize=1,
+    )
+    assert process.stdout is not None
+    with process.stdout:
+        for line in process.stdout:
+            summary.feed(line)
+    summary.returncode = process.wait()
+    return summary
+
+
+def message_dict(key: MessageKey) -> Dict[str, Any]:
+    return dict(zip(MESSAGE_FIELDS, key))
+
+
+def sort_key(key: MessageKey) -> Tuple[Any, ...]:
+    message = message_dict(key)
+    return (message["line"] or 0, message["column"] or 0, str(message["ruleId"]), str(message["message"]))
+
+
+def diff_summaries(cli: RecordSummary, headless: RecordSummary) -> List[Dict[str, Any]]:
+    """Return one entry per file whose messages or counts differ."""
+
+    mismatches: List[Dict[str, Any]] = []
+    for file_path in sorted(set(cli.messages) | set(headless.messages), key=str):
+        expected = cli.messages.get(file_path, Counter())
+        actual = headless.messages.get(file_path, Counter())
+        missing = expected - actual
+        unexpected = actual - expected
+        cli_counts = cli.counts.get(file_path)
+        headless_counts = headless.counts.get(file_path)
+        if not missing and not unexpected and cli_counts == headless_counts:
+            continue
+
+        entry: Dict[str, Any] = {"filePath": file_path}
+        if missing:
+            entry["missing"] = [
+                dict(message_dict(key), count=count)
+                for key, count in sorted(missing.items(), key=lambda item: sort_key(item[0]))
+            ]
+        if unexpected:
+            entry["unexpected"] = [
+                dict(message_dict(key), count=count)
+                for key, count in sorted(unexpected.items(), key=lambda item: sort_key(item[0]))
+            ]
+        if cli_counts != headless_counts:
+            entry["counts"] = {"cli": cli_counts, "headless": headless_counts}
+        mismatches.append(entry)
+    return mismatches
+
+
+def print_sources(mismatches: List[Dict[str, Any]], headless: RecordSummary) -> None:
+    """Print the buffer text the collector saw for each mismatching file."""
+
+    for entry in mismatches:
+        source = headless.sources.get(entry["filePath"])
+        if source is None:
+            continue
+        print(f"=== Buffer source: {entry['filePath']} ===")
+        for number, line in enumerate(source.split("\n"), start=1):
+            print(f"{number:>5}  {line}")
 
 
 def resolve_repo_path(value: str | Path) -> Path:
@@ -77,7 +159,17 @@ def main() -> int:
     parser.add_argument("--nvim-cmd", default="nvim", help="Neovim executable to run in headless mode")
     parser.add_argument("--init", default=str(DEFAULT_INIT), help="Neovim init file that loads the plugin")
     parser.add_argument("--collector", default=str(DEFAULT_COLLECTOR), help="Collector script to execute inside Neovim")
+    parser.add_argument(
+        "--formatter",
+        default=str(DEFAULT_FORMATTER),
+        help="ESLint formatter that emits NDJSON records matching the collector",
+    )
     parser.add_argument("--timeout", type=int, default=20000, help="Timeout (ms) for the collector to wait for diagnostics")
+    parser.add_argument(
+        "--include-source",
+        action="store_true",
+        help="Print the buffer text the collector saw for files that mismatch (debugging only)",
+    )
     args = parser.parse_args()
 
     repo_root = REPO_ROOT
@@ -88,20 +180,20 @@ def main() -> int:
         print(f"Target file {target_path} does not exist", file=sys.stderr)
         return 2
 
-    eslint_cmd = shlex.split(args.eslint_cmd) + [args.target, "--format", "json"]
-    eslint_result = run_command(eslint_cmd, cwd=fixture_root)
-    if eslint_result.returncode not in (0, 1):
+    formatter_path = resolve_repo_path(args.formatter)
+    eslint_cmd = shlex.split(args.eslint_cmd) + [args.target, "--format", str(formatter_path)]
+    cli = stream_records(eslint_cmd, RecordSummary("ESLint CLI"), cwd=fixture_root)
+    if cli.returncode not in (0, 1):
         print("ESLint CLI failed:", file=sys.stderr)
-        sys.stderr.write(eslint_result.stdout)
-        sys.stderr.write(eslint_result.stderr)
-        return eslint_result.returncode
+        cli.report_noise()
+        return cli.returncode
 
     init_path = resolve_repo_path(args.init)
     collector_path = resolve_repo_path(args.collector)
 
     collector_expr = (
-        "lua local collector = dofile(%r); collector.collect({ timeout = %d })"
-        % (str(collector_path), args.timeout)
+        "lua local collector = dofile(%r); collector.collect({ timeout = %d, include_source = %s })"
+        % (str(collector_path), args.timeout, "true" if args.include_source else "false")
     )
 
     headless_cmd = (
@@ -115,40 +207,29 @@ def main() -> int:
             "+qa",
         ]
     )
-    headless_result = run_command(headless_cmd, cwd=repo_root)
-    if headless_result.returncode != 0:
+    headless = stream_records(headless_cmd, RecordSummary("headless collector"), cwd=repo_root)
+    if headless.returncode != 0:
         print("Headless Neovim run failed:", file=sys.stderr)
-        sys.stderr.write(headless_result.stdout)
-        sys.stderr.write(headless_result.stderr)
-        return headless_result.returncode
-
-    try:
-        eslint_json = load_json(eslint_result.stdout, label="ESLint CLI")
-    except ValueError as exc:
-        print(exc, file=sys.stderr)
-        return 1
-
-    headless_output = headless_result.stdout if headless_result.stdout.strip() else headless_result.stderr
-    try:
-        headless_json = load_json(headless_output, label="headless collector")
-    except ValueError as exc:
-        print(exc, file=sys.stderr)
-        return 1
-
-    canonical_cli = canonicalize(eslint_json)
-    canonical_headless = canonicalize(headless_json)
-
-    print("=== ESLint CLI JSON ===")
-    print(json.dumps(eslint_json, indent=2, ensure_ascii=False))
-    print("=== Headless Neovim JSON ===")
-    print(json.dumps(headless_json, indent=2, ensure_ascii=False))
-    print("=== Canonical comparison ===")
-    print(json.dumps({"cli": canonical_cli, "headless": canonical_headless}, indent=2, ensure_ascii=False))
-
-    if canonical_cli == canonical_headless:
-        print("SUCCESS: headless Neovim diagnostics match ESLint CLI output")
+        headless.report_noise()
+        return headless.returncode
+
+    for summary in (cli, headless):
+        if not summary.ended:
+            print(f"{summary.label} produced no complete NDJSON stream", file=sys.stderr)
+            summary.report_noise()
+            return 1
+
+    mismatches = diff_summaries(cli, headless)
+    if not mismatches:
+        print(
+            f"SUCCESS: headless Neovim diagnostics match ESLint CLI output "
+            f"({len(cli.messages)} file(s), {cli.message_total} message(s))"
+        )
         return 0
 
+    print("=== Parity diff (missing = CLI only, unexpected = headless only) ===")
+    print(json.dumps(mismatches, indent=2, ensure_ascii=False))
+    print_sources(mismatches, headless)
     print("FAILURE: headless Neovim diagnostics differ from ESLint CLI output", file=sys.stderr)
     return 1
 
@@ -1,18 +1,33 @@
 #!/usr/bin/env python3
-"""Seed ESLint violations and verify Neovim parity across multiple files."""
+"""Seed ESLint violations and verify Neovim parity across multiple files.
+
+After a target passes, the suite records a manifest of everything that can
+change its result: the seeded file, the resolved ESLint config, the server
+bundle, the plugin sources, the Neovim version, and the harness itself. Later
+runs skip targets whose manifest still matches, unless ``--force`` is given.
+"""
 
 from __future__ import annotations
 
 import argparse
+import hashlib
+import json
 import os
+import shlex
 import subprocess
 import sys
+import time
 from pathlib import Path
-from typing import List
+from typing import Any, Dict, List
 
 SCRIPT_DIR = Path(__file__).resolve().parent
+REPO_ROOT = SCRIPT_DIR.parents[2]
 SEED_SCRIPT = SCRIPT_DIR / "seed_eslint_errors.py"
 PARITY_SCRIPT = SCRIPT_DIR / "run_eslint_parity.py"
+FORMATTER = SCRIPT_DIR / "ndjson_formatter.cjs"
+SERVER_BUNDLE = REPO_ROOT / "vscode-eslint" / "server" / "out" / "eslintServer.js"
+PLUGIN_DIR = REPO_ROOT / "lua" / "nvim-eslint"
+DEFAULT_MANIFEST_FILE = Path("~/.cache/nvim-eslint/parity-manifests.json")
 
 DEFAULT_TARGETS = [
     "packages/create-turbo/src/cli.ts",
@@ -78,9 +93,105 @@ def parse_args(argv: List[str] | None = None) -> argparse.Namespace:
         action="store_true",
         help="Skip injecting ESLint violations before running the parity checks.",
     )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Re-verify every target even if its inputs match a previous passing run.",
+    )
+    parser.add_argument(
+        "--manifest-file",
+        type=Path,
+        default=DEFAULT_MANIFEST_FILE,
+        help="Where manifests of passing targets are stored (default: %(default)s).",
+    )
     return parser.parse_args(argv)
 
 
+def sha256_bytes(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def sha256_file(path: Path) -> str:
+    return sha256_bytes(path.read_bytes()) if path.is_file() else "missing"
+
+
+def sha256_tree(root: Path) -> str:
+    digest = hashlib.sha256()
+    for path in sorted(root.rglob("*")):
+        if path.is_file():
+            digest.update(str(path.relative_to(root)).encode())
+            digest.update(b"\0")
+            digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def nvim_version(nvim_cmd: str) -> str | None:
+    try:
+        result = run_command(shlex.split(nvim_cmd) + ["--version"])
+    except OSError:
+        return None
+    if result.returncode != 0 or not result.stdout:
+        return None
+    return result.stdout.splitlines()[0].strip()
+
+
+def shared_inputs(fixture_root: Path, args: argparse.Namespace) -> Dict[str, Any] | None:
+    """Inputs that apply to every target; None when the Neovim version is unknown."""
+
+    version = nvim_version(args.nvim_cmd)
+    if version is None:
+        return None
+    harness = [SEED_SCRIPT, PARITY_SCRIPT, FORMATTER, Path(args.init), Path(args.collector)]
+    return {
+        "nvim_version": version,
+        "server_bundle": sha256_file(SERVER_BUNDLE),
+        "plugin_sources": sha256_tree(PLUGIN_DIR),
+        "harness": sha256_bytes("\0".join(sha256_file(path) for path in harness).encode()),
+        "harness_args": {"errors": args.errors, "eslint_cmd": args.eslint_cmd, "timeout": args.timeout},
+        # Plugin and parser versions are not part of --print-config output.
+        "lockfile": sha256_file(fixture_root / "pnpm-lock.yaml"),
+    }
+
+
+def resolved_config_hash(fixture_root: Path, eslint_cmd: str, target: str) -> str | None:
+    try:
+        result = run_command(shlex.split(eslint_cmd) + ["--print-config", target], cwd=fixture_root)
+    except OSError:
+        return None
+    if result.returncode != 0:
+        return None
+    return sha256_bytes(result.stdout.encode())
+
+
+def target_manifest(
+    fixture_root: Path, args: argparse.Namespace, target: str, shared: Dict[str, Any] | None
+) -> Dict[str, Any] | None:
+    """Hash every input of a parity check; None when one of them cannot be determined."""
+
+    if shared is None:
+        return None
+    config = resolved_config_hash(fixture_root, args.eslint_cmd, target)
+    if config is None:
+        return None
+    inputs = dict(shared, target=sha256_file(fixture_root / target), eslint_config=config)
+    return {"digest": sha256_bytes(json.dumps(inputs, sort_keys=True).encode()), "inputs": inputs}
+
+
+def load_manifests(path: Path) -> Dict[str, Any]:
+    try:
+        return json.loads(path.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def save_manifests(path: Path, manifests: Dict[str, Any]) -> None:
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(manifests, indent=2, sort_keys=True) + "\n")
+    except OSError as exc:
+        print(f"Could not write parity manifests to {path}: {exc}", file=sys.stderr)
+
+
 def seed_errors(fixture_root: Path, target: str, errors: List[str] | None) -> None:
     target_path = fixture_root / target
     if not target_path.exists():
@@ -132,7 +243,14 @@ def main(argv: List[str] | None = None) -> int:
         print(f"Fixture repository {fixture_root} does not exist", file=sys.stderr)
         return 2
 
+    manifest_file = args.manifest_file.expanduser()
+    manifests = load_manifests(manifest_file)
+    shared = shared_inputs(fixture_root, args)
+    if shared is None:
+        print("Could not determine the Neovim version; every target will be verified.", file=sys.stderr)
+
     failures: list[str] = []
+    skipped: list[str] = []
     for target in args.targets:
         print("==============================")
         print(f"Target: {target}")
@@ -146,10 +264,22 @@ def main(argv: List[str] | None = None) -> int:
             failures.append(target)
             continue
 
+        manifest = target_manifest(fixture_root, args, target, shared)
+        previous = manifests.get(target)
+        if not args.force and manifest and previous and previous.get("digest") == manifest["digest"]:
+            print(f"Inputs unchanged since the passing run at {previous['verified_at']}; skipping.")
+            skipped.append(target)
+            continue
+
         status = run_parity(fixture_root, args, target)
         if status != 0:
             print(f"Parity check failed for {target}", file=sys.stderr)
             failures.append(target)
+            manifests.pop(target, None)
+        elif manifest:
+            manifest["verified_at"] = time.strftime("%Y-%m-%dT%H:%M:%S%z")
+            manifests[target] = manifest
+        save_manifests(manifest_file, manifests)
 
     if failures:
         print("", file=sys.stderr)
@@ -158,6 +288,8 @@ def main(argv: List[str] | None = None) -> int:
             print(f" - {entry}", file=sys.stderr)
         return 1
 
+    if skipped:
+        print(f"Skipped {len(skipped)} unchanged target(s); pass --force to re-verify them.")
     print("All targets matched ESLint CLI output.")
     return 0
 
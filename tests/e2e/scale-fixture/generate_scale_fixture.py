@@ -0,0 +1,327 @@
+#!/usr/bin/env python3
+"""Generate a synthetic pnpm monorepo for large-scale ESLint performance tests.
+
+The generator works fully offline. Every package receives its own ESLint
+configuration (flat or legacy, mixed by ratio) and TypeScript sources padded
+with valid filler code plus the same violation snippets that
+``seed_eslint_errors.py`` injects. Dependencies are not installed: the root
+``node_modules`` is symlinked to an existing store that already contains
+ESLint and the typescript-eslint parser and plugin, for example the Turborepo
+fixture's ``node_modules``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any, Dict, List
+
+# --- Section: Constants ---
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+PARITY_DIR = SCRIPT_DIR.parent / "parity"
+sys.path.insert(0, str(PARITY_DIR))
+
+from seed_eslint_errors import ERROR_CHOICES, build_snippet  # noqa: E402
+
+MANIFEST_NAME = "scale-fixture.json"
+FIXTURE_ENV_VAR = "NVIM_ESLINT_FIXTURE"
+REQUIRED_MODULES = ("eslint", "@typescript-eslint/parser", "@typescript-eslint/eslint-plugin")
+
+# Sizes relative to the Turborepo checkout used by the parity suite.
+PRESETS: Dict[str, Dict[str, int]] = {
+    "1x": {"packages": 30, "files_per_package": 40, "lines_per_file": 150},
+    "10x": {"packages": 300, "files_per_package": 40, "lines_per_file": 150},
+    "100x": {"packages": 1500, "files_per_package": 80, "lines_per_file": 150},
+}
+
+RULE_IDS = {
+    "unused-vars": "@typescript-eslint/no-unused-vars",
+    "explicit-any": "@typescript-eslint/no-explicit-any",
+    "prefer-const": "prefer-const",
+    "no-console": "no-console",
+    "eqeqeq": "eqeqeq",
+}
+
+FLAT_CONFIG_NAME = "eslint.config.mjs"
+LEGACY_CONFIG_NAME = ".eslintrc.json"
+
+
+# --- Section: Content builders ---
+
+
+def rules_config() -> Dict[str, str]:
+    return {rule_id: "error" for rule_id in RULE_IDS.values()}
+
+
+def flat_config() -> str:
+    rules = json.dumps(rules_config(), indent=6)[:-1] + "    }"
+    return (
+        'import tsParser from "@typescript-eslint/parser";\n'
+        'import tsPlugin from "@typescript-eslint/eslint-plugin";\n'
+        "\n"
+        "export default [\n"
+        "  {\n"
+        '    files: ["**/*.ts"],\n'
+        "    languageOptions: { parser: tsParser },\n"
+        '    plugins: { "@typescript-eslint": tsPlugin },\n'
+        f"    rules: {rules},\n"
+        "  },\n"
+        "];\n"
+    )
+
+
+def legacy_config() -> str:
+    config = {
+        "root": True,
+        "parser": "@typescript-eslint/parser",
+        "plugins": ["@typescript-eslint"],
+        "rules": rules_config(),
+    }
+    return json.dumps(config, indent=2) + "\n"
+
+
+def filler_chunk(index: int) -> str:
+    return (
+        f"export function generatedValue{index}(input: number): number {{\n"
+        f"  return input + {index};\n"
+        "}\n"
+        "\n"
+    )
+
+
+def build_source(
+    relative_path: str,
+    lines_per_file: int,
+    density: float,
+    errors: List[str],
+    rng: random.Random,
+) -> tuple[str, Dict[str, int]]:
+    """Return file contents and the per-rule violation counts they contain.
+
+    ``density`` is the expected number of violations per 100 lines; the
+    fractional part is resolved with ``rng`` so totals stay proportional.
+    """
+
+    expected = lines_per_file * density / 100
+    violation_count = int(expected) + (1 if rng.random() < expected - int(expected) else 0)
+    if not errors:
+        violation_count = 0
+    chosen = [rng.choice(errors) for _ in range(violation_count)]
+
+    chunks = [f"// Generated by generate_scale_fixture.py: {relative_path}\n"]
+    line_total = 1
+    index = 0
+    pending = list(chosen)
+    while line_total < lines_per_file or index == 0 or pending:
+        if pending and (rng.random() < 0.5 or line_total >= lines_per_file):
+            snippet = build_snippet([pending.pop()]) + "\n"
+        else:
+            snippet = filler_chunk(index)
+            index += 1
+        chunks.append(snippet)
+        line_total += snippet.count("\n")
+
+    counts: Dict[str, int] = {}
+    for name in chosen:
+        counts[name] = counts.get(name, 0) + 1
+    return "".join(chunks), counts
+
+
+# --- Section: Generation ---
+
+
+def write_text(path: Path, content: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+
+
+def link_module_store(output: Path, store: Path | None) -> List[str]:
+    """Symlink the shared ``node_modules`` store and return the required modules it lacks."""
+
+    if store is None:
+        return []
+    store = store.resolve()
+    (output / "node_modules").symlink_to(store, target_is_directory=True)
+    return [name for name in REQUIRED_MODULES if not (store / name).exists()]
+
+
+def generate(args: argparse.Namespace) -> Dict[str, Any]:
+    output = Path(args.output).resolve()
+    if output.exists():
+        if not args.force:
+            raise FileExistsError(f"{output} already exists; pass --force to replace it")
+        shutil.rmtree(output)
+    output.mkdir(parents=True)
+
+    rng = random.Random(args.seed)
+    errors = list(dict.fromkeys(args.errors))
+
+    write_text(
+        output / "package.json",
+        json.dumps({"name": "nvim-eslint-scale-fixture", "private": True}, indent=2) + "\n",
+    )
+    write_text(output / "pnpm-workspace.yaml", 'packages:\n  - "packages/*"\n')
+
+    packages: List[Dict[str, Any]] = []
+    totals: Dict[str, int] = {name: 0 for name in errors}
+    width = len(str(args.packages))
+    for package_index in range(args.packages):
+        name = f"pkg-{package_index:0{width}d}"
+        package_dir = output / "packages" / name
+        config_kind = "flat" if rng.random() < args.flat_ratio else "legacy"
+
+        write_text(
+            package_dir / "package.json",
+            json.dumps({"name": f"@scale/{name}", "version": "0.0.0", "private": True}, indent=2) + "\n",
+        )
+        if config_kind == "flat":
+            write_text(package_dir / FLAT_CONFIG_NAME, flat_config())
+        else:
+            write_text(package_dir / LEGACY_CONFIG_NAME, legacy_config())
+
+        files: List[Dict[str, Any]] = []
+        for file_index in range(args.files_per_package):
+            relative = f"packages/{name}/src/module-{file_index:03d}.ts"
+            source, counts = build_source(relative, args.lines_per_file, args.violation_density, errors, rng)
+            write_text(output / relative, source)
+            for rule, count in counts.items():
+                totals[rule] += count
+            files.append({"path": relative, "lines": source.count("\n"), "violations": counts})
+
+        packages.append({"name": name, "dir": f"packages/{name}", "config": config_kind, "files": files})
+
+    missing = link_module_store(output, args.node_modules)
+
+    if not args.no_git:
+        subprocess.run(["git", "init", "--quiet", str(output)], check=True)
+
+    manifest = {
+        "settings": {
+            "packages": args.packages,
+            "files_per_package": args.files_per_package,
+            "lines_per_file": args.lines_per_file,
+            "violation_density": args.violation_density,
+            "flat_ratio": args.flat_ratio,
+            "errors": errors,
+            "seed": args.seed,
+            "node_modules": str(args.node_modules) if args.node_modules else None,
+        },
+        "rule_ids": {name: RULE_IDS[name] for name in errors},
+        "totals": {
+            "packages": len(packages),
+            "files": sum(len(package["files"]) for package in packages),
+            "flat_configs": sum(1 for package in packages if package["config"] == "flat"),
+            "violations": totals,
+        },
+        "missing_modules": missing,
+        "packages": packages,
+    }
+    write_text(output / MANIFEST_NAME, json.dumps(manifest, indent=2) + "\n")
+    return manifest
+
+
+# --- Section: Argument parsing ---
+
+
+def default_module_store() -> Path | None:
+    fixture = os.environ.get(FIXTURE_ENV_VAR)
+    if not fixture:
+        return None
+    store = Path(fixture) / "node_modules"
+    return store if store.is_dir() else None
+
+
+def parse_args(argv: List[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Generate an offline pnpm monorepo with configurable size and ESLint violation density.",
+    )
+    parser.add_argument("output", help="Directory to create the fixture in.")
+    parser.add_argument(
+        "--preset",
+        choices=sorted(PRESETS),
+        default="1x",
+        help="Base size relative to the Turborepo fixture. Explicit size flags override it.",
+    )
+    parser.add_argument("--packages", type=int, help="Number of workspace packages.")
+    parser.add_argument("--files-per-package", type=int, help="TypeScript files generated in each package.")
+    parser.add_argument("--lines-per-file", type=int, help="Approximate line count of each generated file.")
+    parser.add_argument(
+        "--violation-density",
+        type=float,
+        default=2.0,
+        help="Expected ESLint violations per 100 lines (default: %(default)s).",
+    )
+    parser.add_argument(
+        "--errors",
+        choices=ERROR_CHOICES,
+        nargs="+",
+        default=list(ERROR_CHOICES),
+        help="Violation kinds to distribute across files. Defaults to every supported kind.",
+    )
+    parser.add_argument(
+        "--flat-ratio",
+        type=float,
+        default=0.5,
+        help="Fraction of packages that use a flat config; the rest use .eslintrc.json (default: %(default)s).",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Random seed so fixtures are reproducible.")
+    parser.add_argument(
+        "--node-modules",
+        type=Path,
+        default=default_module_store(),
+        help=(
+            "Existing node_modules containing eslint and typescript-eslint to symlink into the fixture "
+            f"(default: ${FIXTURE_ENV_VAR}/node_modules when present)."
+        ),
+    )
+    parser.add_argument("--no-git", action="store_true", help="Skip `git init` at the fixture root.")
+    parser.add_argument("--force", action="store_true", help="Replace the output directory if it exists.")
+    args = parser.parse_args(argv)
+
+    for key, value in PRESETS[args.preset].items():
+        if getattr(args, key) is None:
+            setattr(args, key, value)
+    if not 0.0 <= args.flat_ratio <= 1.0:
+        parser.error("--flat-ratio must be between 0 and 1")
+    if args.violation_density < 0:
+        parser.error("--violation-density must not be negative")
+    return args
+
+
+# --- Section: Entry point ---
+
+
+def main(argv: List[str] | None = None) -> int:
+    args = parse_args(argv)
+    try:
+        manifest = generate(args)
+    except (FileExistsError, subprocess.CalledProcessError) as exc:
+        print(exc, file=sys.stderr)
+        return 2
+
+    totals = manifest["totals"]
+    print(
+        f"Generated {totals['packages']} packages / {totals['files']} files "
+        f"({totals['flat_configs']} flat configs) at {Path(args.output).resolve()}"
+    )
+    print("Violations:", json.dumps(totals["violations"], sort_keys=True))
+    if args.node_modules is None:
+        print("No module store linked; only a stand-in language server can lint this fixture.")
+    elif manifest["missing_modules"]:
+        print(
+            "Warning: module store is missing " + ", ".join(manifest["missing_modules"])
+            + "; ESLint will not resolve until they are available.",
+            file=sys.stderr,
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
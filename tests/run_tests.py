@@ -4,12 +4,16 @@
 from __future__ import annotations
 
 import argparse
+import hashlib
+import json
 import os
 import shlex
+import shutil
 import subprocess
 import sys
+import time
 from pathlib import Path
-from typing import Dict, List
+from typing import Any, Dict, List
 
 # --- Section: Constants ---
 
@@ -17,10 +21,23 @@ REPO_ROOT = Path(__file__).resolve().parents[1]
 SUITES = {
     "parity": Path("tests/e2e/parity/run_eslint_parity_suite.py"),
     "config-reload": Path("tests/e2e/config-reload/run_config_reload.py"),
+    "fake-server": Path("tests/e2e/fake-server/run_fake_server.py"),
+    "scale": Path("tests/bench/multi-root/run_multi_root.py"),
 }
+# Suites that lint the Turborepo checkout or borrow its node_modules; the others
+# generate their own workspace.
+FIXTURE_SUITES = {"parity", "config-reload", "scale"}
 TURBO_REPO_URL = "https://github.com/vercel/turborepo.git"
 FIXTURE_ENV_VAR = "NVIM_ESLINT_FIXTURE"
 DEFAULT_FIXTURE_ROOT = Path(os.environ.get(FIXTURE_ENV_VAR, "/workspace/turborepo"))
+FIXTURE_CACHE_ENV_VAR = "NVIM_ESLINT_FIXTURE_CACHE"
+DEFAULT_FIXTURE_CACHE = Path(
+    os.environ.get(FIXTURE_CACHE_ENV_VAR, Path.home() / ".cache" / "nvim-eslint" / "fixtures")
+)
+FIXTURE_LOCKFILE = "pnpm-lock.yaml"
+# Lives under .git so `git clean -fd` between suites never removes it.
+FIXTURE_STAMP = Path(".git") / "nvim-eslint-fixture.json"
+LATEST_SNAPSHOT_FILE = "latest"
 
 
 # --- Section: Process helpers ---
@@ -37,22 +54,223 @@ def run_command(command: List[str], *, cwd: Path | None = None) -> None:
         )
 
 
-def ensure_fixture_root() -> Path:
-    """Clone or reset the turborepo fixture and install dependencies."""
+def git_output(command: List[str], *, cwd: Path) -> str | None:
+    """Return the stripped stdout of a git command, or ``None`` when it fails."""
+
+    result = subprocess.run(["git", *command], cwd=cwd, text=True, capture_output=True)
+    if result.returncode != 0:
+        return None
+    return result.stdout.strip()
+
+
+# --- Section: Fixture cache ---
+
+
+def fixture_cache_key(fixture_root: Path) -> str | None:
+    """Key a prepared fixture by its checked-out commit and the pnpm lockfile contents."""
+
+    commit = git_output(["rev-parse", "HEAD"], cwd=fixture_root)
+    lockfile = fixture_root / FIXTURE_LOCKFILE
+    if not commit or not lockfile.is_file():
+        return None
+    lock_digest = hashlib.sha256(lockfile.read_bytes()).hexdigest()
+    return f"{commit}-{lock_digest[:16]}"
+
+
+def read_json_file(path: Path) -> Dict[str, Any]:
+    try:
+        return json.loads(path.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def write_json_file(path: Path, payload: Dict[str, Any]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(payload, indent=2) + "\n")
+
+
+def _link_tree(source: Path, destination: Path, *, share_files: bool) -> None:
+    destination.mkdir()
+    with os.scandir(source) as entries:
+        for entry in entries:
+            target = destination / entry.name
+            if entry.is_symlink():
+                os.symlink(os.readlink(entry.path), target)
+            elif entry.is_dir():
+                _link_tree(Path(entry.path), target, share_files=share_files or entry.name == "node_modules")
+            elif share_files:
+                try:
+                    os.link(entry.path, target)
+                except OSError:
+                    shutil.copy2(entry.path, target)
+            else:
+                shutil.copy2(entry.path, target)
+    shutil.copystat(source, destination)
+
+
+def link_tree(source: Path, destination: Path, *, share_files: bool = False) -> str:
+    """Materialize ``source`` at ``destination`` without duplicating file data where possible.
+
+    Reflinks are copy-on-write and therefore safe for every file. Without them,
+    only ``node_modules`` content (or everything, with ``share_files``) is
+    hardlinked: the suites seed violations by rewriting source files in place,
+    which would otherwise leak into the cache.
+    """
+
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    result = subprocess.run(
+        ["cp", "-a", "--reflink=always", str(source), str(destination)],
+        capture_output=True,
+    )
+    if result.returncode == 0:
+        return "reflink"
+
+    if destination.exists():
+        shutil.rmtree(destination)
+    _link_tree(source, destination, share_files=share_files)
+    return "hardlink"
+
+
+def latest_snapshot(cache_dir: Path) -> Path | None:
+    key_file = cache_dir / LATEST_SNAPSHOT_FILE
+    if not key_file.is_file():
+        return None
+    entry = cache_dir / key_file.read_text().strip()
+    if not (entry / "tree").is_dir():
+        return None
+    return entry
+
+
+def store_snapshot(fixture_root: Path, cache_dir: Path, key: str, prepare_seconds: float) -> Path:
+    """Copy a freshly prepared fixture into the cache under ``key``."""
+
+    entry = cache_dir / key
+    if not (entry / "tree").is_dir():
+        staging = cache_dir / f".{key}.tmp-{os.getpid()}"
+        if staging.exists():
+            shutil.rmtree(staging)
+        link_tree(fixture_root, staging / "tree")
+        write_json_file(
+            staging / "meta.json",
+            {"key": key, "prepare_seconds": round(prepare_seconds, 3), "created": time.time()},
+        )
+        if entry.exists():
+            shutil.rmtree(entry)
+        staging.rename(entry)
+    (cache_dir / LATEST_SNAPSHOT_FILE).write_text(key + "\n")
+    return entry
+
+
+def restore_snapshot(entry: Path, fixture_root: Path) -> None:
+    """Replace the fixture with the snapshot stored in ``entry``."""
+
+    started = time.monotonic()
+    if fixture_root.exists():
+        shutil.rmtree(fixture_root)
+    mode = link_tree(entry / "tree", fixture_root)
+    report_cache_hit(entry, f"restored via {mode}", time.monotonic() - started)
+
+
+def restore_dependencies(entry: Path, fixture_root: Path) -> None:
+    """Replace only the ``node_modules`` directories of the fixture with those in ``entry``.
+
+    Used for checkouts the launcher did not create, so their ``.git``, local
+    branches and ignored files are left alone.
+    """
+
+    started = time.monotonic()
+    tree = entry / "tree"
+    modes = set()
+    for directory, subdirs, _ in os.walk(tree):
+        if ".git" in subdirs:
+            subdirs.remove(".git")
+        if "node_modules" not in subdirs:
+            continue
+        subdirs.remove("node_modules")
+        relative = Path(directory).relative_to(tree) / "node_modules"
+        target = fixture_root / relative
+        if target.is_symlink() or target.is_file():
+            target.unlink()
+        elif target.exists():
+            shutil.rmtree(target)
+        modes.add(link_tree(tree / relative, target, share_files=True))
+    detail = f"restored node_modules via {'/'.join(sorted(modes))}" if modes else "no node_modules in snapshot"
+    report_cache_hit(entry, detail, time.monotonic() - started)
+
+
+def report_cache_hit(entry: Path, detail: str, elapsed: float) -> None:
+    meta = read_json_file(entry / "meta.json")
+    saved = max(float(meta.get("prepare_seconds", 0.0)) - elapsed, 0.0)
+    print(f"Fixture cache hit ({entry.name}): {detail} in {elapsed:.1f}s, saved ~{saved:.1f}s")
+
+
+# --- Section: Fixture preparation ---
+
+
+def ensure_fixture_root(cache_dir: Path | None = None, *, refresh: bool = False) -> Path:
+    """Prepare the turborepo fixture, reusing a cached snapshot when one matches.
+
+    ``cache_dir`` disables the cache when ``None``. ``refresh`` ignores cached
+    snapshots, moves a checkout this launcher created to the latest upstream
+    commit (or clones it) and reinstalls, storing the result afterwards.
+
+    Only directories the launcher created (recorded as ``owned`` in the stamp)
+    are ever replaced wholesale. A checkout supplied through
+    ``$NVIM_ESLINT_FIXTURE`` keeps its ``.git`` and ignored files; a cache hit
+    only restores its ``node_modules``.
+    """
 
     fixture_root = DEFAULT_FIXTURE_ROOT.resolve()
     fixture_root.parent.mkdir(parents=True, exist_ok=True)
+    use_cache = cache_dir is not None and not refresh
+    started = time.monotonic()
 
     if fixture_root.exists():
         print(f"Resetting existing Turborepo fixture at {fixture_root}")
         run_command(["git", "reset", "--hard", "HEAD"], cwd=fixture_root)
         run_command(["git", "clean", "-fd"], cwd=fixture_root)
+        stamp = read_json_file(fixture_root / FIXTURE_STAMP)
+        owned = bool(stamp.get("owned"))
+        if refresh and owned:
+            print(f"Updating Turborepo fixture from {TURBO_REPO_URL}")
+            run_command(["git", "fetch", "--depth", "1", TURBO_REPO_URL, "HEAD"], cwd=fixture_root)
+            run_command(["git", "reset", "--hard", "FETCH_HEAD"], cwd=fixture_root)
+        elif refresh:
+            print(f"Keeping the current commit of {fixture_root}; only fixtures cloned by this launcher are updated")
+
+        key = fixture_cache_key(fixture_root)
+        if use_cache and key:
+            entry = cache_dir / key
+            if stamp.get("key") == key and (fixture_root / "node_modules").is_dir():
+                report_cache_hit(entry, "fixture already prepared", time.monotonic() - started)
+                return fixture_root
+            if (entry / "tree").is_dir():
+                if owned:
+                    restore_snapshot(entry, fixture_root)
+                else:
+                    restore_dependencies(entry, fixture_root)
+                write_json_file(fixture_root / FIXTURE_STAMP, {"key": key, "owned": owned})
+                return fixture_root
     else:
+        owned = True
+        entry = latest_snapshot(cache_dir) if use_cache else None
+        if entry is not None:
+            restore_snapshot(entry, fixture_root)
+            key = fixture_cache_key(fixture_root)
+            write_json_file(fixture_root / FIXTURE_STAMP, {"key": key, "owned": owned})
+            return fixture_root
         print(f"Cloning Turborepo fixture into {fixture_root}")
         run_command(["git", "clone", "--depth", "1", TURBO_REPO_URL, str(fixture_root)])
 
     print("Installing Turborepo dependencies via pnpm")
     run_command(["pnpm", "install", "--frozen-lockfile"], cwd=fixture_root)
+    prepare_seconds = time.monotonic() - started
+
+    key = fixture_cache_key(fixture_root)
+    if cache_dir is not None and key:
+        write_json_file(fixture_root / FIXTURE_STAMP, {"key": key, "owned": owned})
+        entry = store_snapshot(fixture_root, cache_dir, key, prepare_seconds)
+        print(f"Fixture cache miss ({key}): prepared in {prepare_seconds:.1f}s, stored snapshot at {entry}")
     return fixture_root
 
 
@@ -94,6 +312,25 @@ def parse_args(argv: List[str] | None = None) -> argparse.Namespace:
         action="store_true",
         help="Abort remaining suites after the first failure.",
     )
+    parser.add_argument(
+        "--fixture-cache-dir",
+        type=Path,
+        default=DEFAULT_FIXTURE_CACHE,
+        help=f"Directory holding prepared fixture snapshots (default: ${FIXTURE_CACHE_ENV_VAR} or %(default)s).",
+    )
+    parser.add_argument(
+        "--no-fixture-cache",
+        action="store_true",
+        help="Always reset and reinstall the fixture without reading or writing snapshots.",
+    )
+    parser.add_argument(
+        "--refresh-fixture",
+        action="store_true",
+        help=(
+            "Ignore cached snapshots, update a fixture cloned by this launcher to the latest upstream commit, "
+            "reinstall and store the result."
+        ),
+    )
     parser.add_argument(
         "--list",
         action="store_true",
@@ -155,17 +392,20 @@ def main(argv: List[str] | None = None) -> int:
     selected = args.suites or sorted(SUITES.keys())
     failures: List[str] = []
 
-    try:
-        fixture_root = ensure_fixture_root()
-    except RuntimeError as exc:
-        print(exc, file=sys.stderr)
-        return 1
-
     env = os.environ.copy()
-    env.setdefault(FIXTURE_ENV_VAR, str(fixture_root))
+    fixture_root: Path | None = None
+    if FIXTURE_SUITES.intersection(selected):
+        try:
+            cache_dir = None if args.no_fixture_cache else args.fixture_cache_dir.expanduser().resolve()
+            fixture_root = ensure_fixture_root(cache_dir, refresh=args.refresh_fixture)
+        except RuntimeError as exc:
+            print(exc, file=sys.stderr)
+            return 1
+        env.setdefault(FIXTURE_ENV_VAR, str(fixture_root))
 
     for suite in selected:
-        reset_fixture(fixture_root)
+        if fixture_root is not None and suite in FIXTURE_SUITES:
+            reset_fixture(fixture_root)
         status = run_suite(suite, suite_args[suite], env=env)
         if status != 0:
             print(f"Suite '{suite}' failed with exit code {status}", file=sys.stderr)
@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""Summarize an LSP trace written by ``eslint_rpc_proxy.py``.
+
+Reports per-method request latency histograms, message counts per document,
+payload sizes per method, and the delay between each ``textDocument/didChange``
+and the first diagnostics that cover it: the response to a
+``textDocument/diagnostic`` request for the same document sent after the change
+(the bundled server only answers pull requests), or a
+``textDocument/publishDiagnostics`` notification that covers its version.
+Recordings from the stand-in server in ``tests/e2e/fake-server`` use the same
+record shape and can be analyzed as well.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import sys
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Tuple
+
+# --- Section: Constants ---
+
+BUCKET_BOUNDS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+DID_CHANGE = "textDocument/didChange"
+PUBLISH_DIAGNOSTICS = "textDocument/publishDiagnostics"
+PULL_DIAGNOSTICS = "textDocument/diagnostic"
+
+
+# --- Section: Input ---
+
+
+def iter_records(path: Path) -> Iterator[Dict[str, Any]]:
+    with path.open(encoding="utf-8") as handle:
+        for line in handle:
+            text = line.strip()
+            if not text.startswith("{"):
+                continue
+            try:
+                record = json.loads(text)
+            except json.JSONDecodeError:
+                continue
+            if record.get("event", "message") == "message":
+                yield record
+
+
+# --- Section: Statistics ---
+
+
+def distribution(values: List[float]) -> Dict[str, float] | None:
+    if not values:
+        return None
+    ordered = sorted(values)
+    return {
+        "count": len(ordered),
+        "min": round(ordered[0], 2),
+        "median": round(statistics.median(ordered), 2),
+        "p95": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))], 2),
+        "max": round(ordered[-1], 2),
+    }
+
+
+def histogram(values: List[float]) -> Dict[str, int]:
+    buckets: Dict[str, int] = {}
+    for value in values:
+        label = next(
+            (f"<={bound}ms" for bound in BUCKET_BOUNDS_MS if value <= bound),
+            f">{BUCKET_BOUNDS_MS[-1]}ms",
+        )
+        buckets[label] = buckets.get(label, 0) + 1
+    order = [f"<={bound}ms" for bound in BUCKET_BOUNDS_MS] + [f">{BUCKET_BOUNDS_MS[-1]}ms"]
+    return {label: buckets[label] for label in order if label in buckets}
+
+
+# --- Section: Analysis ---
+
+
+def analyze(records: Iterator[Dict[str, Any]]) -> Dict[str, Any]:
+    pending: Dict[Tuple[Any, str, Any], Dict[str, Any]] = {}
+    latencies: Dict[str, List[float]] = {}
+    sizes: Dict[str, List[int]] = {}
+    per_document: Dict[str, Counter[str]] = {}
+    changes: Dict[str, List[Tuple[Any, float]]] = {}
+    change_latencies: List[float] = []
+    lint_passes: Counter[str] = Counter()
+    counts: Counter[str] = Counter()
+    errors: Counter[str] = Counter()
+    first_t = last_t = None
+
+    for record in records:
+        t = float(record["t"])
+        first_t = t if first_t is None else first_t
+        last_t = t
+        session = record.get("session")
+        direction = record.get("direction")
+        kind = record.get("kind")
+        uri = record.get("uri")
+
+        if kind == "response":
+            # A response travels in the opposite direction of its request.
+            request_direction = "send" if direction == "recv" else "recv"
+            request = pending.pop((session, request_direction, record.get("id")), None)
+            if request is None:
+                continue
+            method = request["method"]
+            latencies.setdefault(method, []).append((t - request["t"]) * 1000)
+            sizes.setdefault(f"{method} (response)", []).append(record.get("size", 0))
+            if record.get("error"):
+                errors[method] += 1
+            elif method == PULL_DIAGNOSTICS and request["uri"]:
+                # The client flushes pending changes before pulling, so a pull
+                # covers every change sent before its request.
+                lint_passes["pull"] += 1
+                remaining = []
+                for version, changed_at in changes.get(request["uri"], []):
+                    if changed_at <= request["t"]:
+                        change_latencies.append((t - changed_at) * 1000)
+                    else:
+                        remaining.append((version, changed_at))
+                changes[request["uri"]] = remaining
+            continue
+
+        method = record.get("method")
+        if not method:
+            continue
+        counts[method] += 1
+        sizes.setdefault(method, []).append(record.get("size", 0))
+        if uri:
+            per_document.setdefault(uri, Counter())[method] += 1
+        if kind == "request":
+            pending[(session, direction, record.get("id"))] = {"method": method, "t": t, "uri": uri}
+
+        if method == DID_CHANGE and uri:
+            changes.setdefault(uri, []).append((record.get("version"), t))
+        elif method == PUBLISH_DIAGNOSTICS and uri:
+            lint_passes["push"] += 1
+            published_version = record.get("version")
+            remaining = []
+            for version, changed_at in changes.get(uri, []):
+                if published_version is None or version is None or version <= published_version:
+                    change_latencies.append((t - changed_at) * 1000)
+                else:
+                    remaining.append((version, changed_at))
+            changes[uri] = remaining
+
+    return {
+        "duration_s": round((last_t - first_t), 3) if first_t is not None and last_t is not None else 0,
+        "message_counts": dict(counts.most_common()),
+        "request_latency_ms": {
+            method: {"summary": distribution(values), "histogram": histogram(values)}
+            for method, values in sorted(latencies.items())
+        },
+        "request_errors": dict(errors),
+        "unanswered_requests": sorted({request["method"] for request in pending.values()}),
+        "payload_bytes": {
+            method: {
+                "count": len(values),
+                "total": sum(values),
+                "mean": round(sum(values) / len(values), 1),
+                "max": max(values),
+            }
+            for method, values in sorted(sizes.items())
+        },
+        "messages_per_document": {uri: dict(counter) for uri, counter in sorted(per_document.items())},
+        "did_change_to_diagnostics_ms": {
+            "summary": distribution(change_latencies),
+            "histogram": histogram(change_latencies),
+            "unresolved_changes": sum(len(entries) for entries in changes.values()),
+            "lint_passes": dict(lint_passes),
+        },
+    }
+
+
+# --- Section: Rendering ---
+
+
+def render_text(report: Dict[str, Any]) -> str:
+    lines = [f"Trace duration: {report['duration_s']}s", "", "Message counts:"]
+    for method, count in report["message_counts"].items():
+        lines.append(f"  {count:>7}  {method}")
+
+    lines += ["", "Request latency (ms):"]
+    for method, entry in report["request_latency_ms"].items():
+        summary = entry["summary"]
+        lines.append(
+            f"  {method}: n={summary['count']} median={summary['median']} p95={summary['p95']} max={summary['max']}"
+        )
+        lines.append("    " + "  ".join(f"{label}:{count}" for label, count in entry["histogram"].items()))
+    if report["unanswered_requests"]:
+        lines.append("  unanswered: " + ", ".join(report["unanswered_requests"]))
+
+    lines += ["", "Payload bytes:"]
+    for method, entry in report["payload_bytes"].items():
+        lines.append(f"  {method}: n={entry['count']} total={entry['total']} mean={entry['mean']} max={entry['max']}")
+
+    lines += ["", "Messages per document:"]
+    for uri, methods in report["messages_per_document"].items():
+        total = sum(methods.values())
+        detail = ", ".join(f"{method}={count}" for method, count in sorted(methods.items()))
+        lines.append(f"  {total:>5}  {uri} ({detail})")
+
+    change = report["did_change_to_diagnostics_ms"]
+    passes = ", ".join(f"{source}={count}" for source, count in sorted(change["lint_passes"].items())) or "none"
+    lines += ["", f"didChange -> diagnostics (ms), lint passes: {passes}"]
+    if change["summary"]:
+        summary = change["summary"]
+        lines.append(f"  n={summary['count']} median={summary['median']} p95={summary['p95']} max={summary['max']}")
+        lines.append("    " + "  ".join(f"{label}:{count}" for label, count in change["histogram"].items()))
+    lines.append(f"  changes without diagnostics: {change['unresolved_changes']}")
+    return "\n".join(lines)
+
+
+# --- Section: Entry point ---
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Analyze an nvim-eslint JSON-RPC trace.")
+    parser.add_argument("trace", type=Path, help="NDJSON trace written by eslint_rpc_proxy.py")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON instead of text.")
+    args = parser.parse_args(argv)
+
+    if not args.trace.exists():
+        print(f"Trace file {args.trace} does not exist", file=sys.stderr)
+        return 2
+
+    report = analyze(iter_records(args.trace))
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print(render_text(report))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""Transparent stdio proxy that traces LSP traffic to an NDJSON file.
+
+The plugin prepends this script to the server command when ``trace`` is set in
+the user config. Every framed JSON-RPC message is forwarded byte for byte and
+logged with a timestamp, its direction, size, method, id, and document URI.
+``direction`` is relative to the server: ``recv`` for client-to-server traffic
+and ``send`` for server-to-client traffic, matching the stand-in server's
+recordings so ``analyze_rpc_trace.py`` can read both.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, List, Tuple
+
+
+# --- Section: Trace output ---
+
+
+class TraceWriter:
+    def __init__(self, path: Path, *, payloads: bool) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._handle = path.open("a", encoding="utf-8")
+        self._payloads = payloads
+        self._lock = threading.Lock()
+        self._session = f"{os.getpid()}-{int(time.time())}"
+
+    def message(self, direction: str, body: bytes, received_at: float) -> None:
+        entry: Dict[str, Any] = {
+            "t": received_at,
+            "event": "message",
+            "session": self._session,
+            "direction": direction,
+            "size": len(body),
+        }
+        try:
+            message = json.loads(body)
+        except ValueError:
+            entry["kind"] = "invalid"
+            self.write(entry)
+            return
+
+        if "method" in message:
+            entry["kind"] = "request" if "id" in message else "notification"
+            entry["method"] = message["method"]
+        else:
+            entry["kind"] = "response"
+            if "error" in message:
+                entry["error"] = True
+        if "id" in message:
+            entry["id"] = message["id"]
+        entry.update(document_fields(message.get("params")))
+        if self._payloads:
+            entry["payload"] = message
+        self.write(entry)
+
+    def write(self, entry: Dict[str, Any]) -> None:
+        with self._lock:
+            self._handle.write(json.dumps(entry) + "\n")
+            self._handle.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            self._handle.close()
+
+
+def document_fields(params: Any) -> Dict[str, Any]:
+    """Extract the document URI (and version) a message refers to, if any."""
+
+    if not isinstance(params, dict):
+        return {}
+    document = params.get("textDocument", params)
+    if isinstance(document, dict) and "uri" in document:
+        fields = {"uri": document["uri"]}
+        if document.get("version") is not None:
+            fields["version"] = document["version"]
+        return fields
+    items = params.get("items")
+    if isinstance(items, list) and items and isinstance(items[0], dict) and "scopeUri" in items[0]:
+        return {"uri": items[0]["scopeUri"]}
+    return {}
+
+
+# --- Section: Framing ---
+
+
+def read_message(stream: BinaryIO) -> Tuple[bytes, bytes] | None:
+    """Return the raw header block and body of the next framed message."""
+
+    headers: List[bytes] = []
+    length = None
+    while True:
+        line = stream.readline()
+        if not line:
+            return None
+        headers.append(line)
+        if line in (b"\r\n", b"\n"):
+            break
+        name, _, value = line.decode("ascii", "replace").partition(":")
+        if name.strip().lower() == "content-length":
+            length = int(value.strip())
+    if length is None:
+        return None
+    body = stream.read(length)
+    if len(body) < length:
+        return None
+    return b"".join(headers), body
+
+
+def pump(source: BinaryIO, destination: BinaryIO, direction: str, trace: TraceWriter) -> None:
+    try:
+        while True:
+            framed = read_message(source)
+            if framed is None:
+                break
+            headers, body = framed
+            received_at = time.time()
+            destination.write(headers)
+            destination.write(body)
+            destination.flush()
+            trace.message(direction, body, received_at)
+    except (BrokenPipeError, ValueError):
+        pass
+    finally:
+        try:
+            destination.close()
+        except OSError:
+            pass
+
+
+# --- Section: Entry point ---
+
+
+def parse_args(argv: List[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Trace JSON-RPC traffic between an LSP client and server.")
+    parser.add_argument("--output", type=Path, required=True, help="NDJSON trace file (appended to).")
+    parser.add_argument("--payloads", action="store_true", help="Include full message bodies in the trace.")
+    parser.add_argument("command", nargs=argparse.REMAINDER, help="Server command, after a `--` separator.")
+    args = parser.parse_args(argv)
+    if args.command and args.command[0] == "--":
+        args.command = args.command[1:]
+    if not args.command:
+        parser.error("missing server command")
+    return args
+
+
+def main(argv: List[str] | None = None) -> int:
+    args = parse_args(argv)
+    trace = TraceWriter(args.output, payloads=args.payloads)
+    server = subprocess.Popen(args.command, stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+    assert server.stdin is not None and server.stdout is not None
+
+    client_to_server = threading.Thread(
+        target=pump, args=(sys.stdin.buffer, server.stdin, "recv", trace), daemon=True
+    )
+    client_to_server.start()
+    pump(server.stdout, sys.stdout.buffer, "send", trace)
+
+    returncode = server.wait()
+    trace.close()
+    return returncode
+
+
+if __name__ == "__main__":
+    # The client-to-server thread may still be blocked reading stdin; skip
+    # interpreter shutdown so it cannot abort while holding the stdin lock.
+    os._exit(main())